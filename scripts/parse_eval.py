@@ -9,23 +9,32 @@ Usage:
 
 import sys
 import re
-from collections import defaultdict
+from collections import Counter, defaultdict
 
 # ─── Patterns ─────────────────────────────────────────────────────────────────
 
-TIER_HEADER = re.compile(r"^=== (TIER .+?) ===$")
-RESULT_LINE = re.compile(
-    r"^\s*\[(PASS|FAIL|MARGINAL)\]\s+(\S+)\s+/\s+(\S+)\s+\((\d+)ms\)\s+--\s+(.*)$"
+TIER_HEADER = r"^=== (?P<tier>TIER .+?) ===$"
+RESULT_LINE = (
+    r"^\s*\[(?P<grade>PASS|FAIL|MARGINAL)\]\s+(?P<model>\S+)\s+/\s+(?P<scenario>\S+)"
+    r"\s+\((?P<latency>\d+)ms\)\s+--\s+(?P<detail>.*)$"
 )
-SUMMARY_HEADER = re.compile(r"^--- (.+?) Summary ---$")
-SUMMARY_TOTALS = re.compile(
-    r"^\s*total=(\d+)\s+pass=(\d+)\s+marginal=(\d+)\s+fail=(\d+)\s+avg_latency=(\d+)ms"
+SUMMARY_HEADER = r"^--- (?P<summary>.+?) Summary ---$"
+SUMMARY_TOTALS = (
+    r"^\s*total=(?P<total>\d+)\s+pass=(?P<passed>\d+)\s+marginal=(?P<marginal>\d+)"
+    r"\s+fail=(?P<fail>\d+)\s+avg_latency=(?P<avg>\d+)ms"
 )
-MODEL_SUMMARY = re.compile(r"^\s*(\S+):\s+(\d+)/(\d+)\s+pass,\s+avg\s+(\d+)ms")
+MODEL_SUMMARY = (
+    r"^\s*(?P<model_name>\S+):\s+(?P<model_pass>\d+)/(?P<model_total>\d+)"
+    r"\s+pass,\s+avg\s+(?P<model_avg>\d+)ms"
+)
+TEST_RESULT = r"^test (?P<test>\S+) \.\.\. (?P<outcome>ok|FAILED)"
+# One scan per line; alternatives are tried in the order above, as separate matches were
+LINE_RE = re.compile("|".join([
+    TIER_HEADER, RESULT_LINE, SUMMARY_HEADER, SUMMARY_TOTALS, MODEL_SUMMARY, TEST_RESULT,
+]))
 HARNESS_RUN = re.compile(r"^\s*running\s+(\S+)\s+/\s+(\S+)\.\.\.")
 SAMPLED = re.compile(r"^\s*sampled models:\s+(.+)$")
 SKIPPED = re.compile(r"^\s*skipped:\s+(.+)$")
-TEST_RESULT = re.compile(r"^test (\S+) \.\.\. (ok|FAILED)")
 
 
 BOOTSTRAP_SCENARIOS = {
@@ -45,29 +54,50 @@ E2E_SCENARIOS = {
     "greeting", "research_task", "code_analysis",
 }
 
+# Canonical tier order (output interleaves, so use a fixed ordering); a dict
+# keeps the order and gives O(1) membership checks
+TIER_ORDER = dict.fromkeys([
+    "TIER 1.1: ConductorBootstrapAgenda",
+    "TIER 1.2: Decide (tool use)",
+    "TIER 1.3: SummarizeChangeset",
+    "TIER 2: Full AgentHarness loop",
+    "TIER 3: End-to-end /conductor/execute",
+])
+
+GRADE_SYMBOLS = {
+    "PASS": "  PASS",
+    "MARGINAL": "  MARG",
+    "FAIL": " *FAIL",
+}
+
+
+# Scenario -> tier, so inference is one dict lookup per result line. Built in
+# reverse so the earlier group wins if a scenario is listed twice.
+SCENARIO_TIER = {
+    scenario: tier
+    for scenarios, tier in reversed((
+        (BOOTSTRAP_SCENARIOS, "TIER 1.1: ConductorBootstrapAgenda"),
+        (DECIDE_SCENARIOS, "TIER 1.2: Decide (tool use)"),
+        (CHANGESET_SCENARIOS, "TIER 1.3: SummarizeChangeset"),
+        (HARNESS_SCENARIOS, "TIER 2: Full AgentHarness loop"),
+        (E2E_SCENARIOS, "TIER 3: End-to-end /conductor/execute"),
+    ))
+    for scenario in scenarios
+}
+
 
 def infer_tier(model, scenario, fallback):
     """Infer tier from scenario name since output interleaves across threads."""
-    if scenario in BOOTSTRAP_SCENARIOS:
-        return "TIER 1.1: ConductorBootstrapAgenda"
-    if scenario in DECIDE_SCENARIOS:
-        return "TIER 1.2: Decide (tool use)"
-    if scenario in CHANGESET_SCENARIOS:
-        return "TIER 1.3: SummarizeChangeset"
-    if scenario in HARNESS_SCENARIOS:
-        return "TIER 2: Full AgentHarness loop"
-    if scenario in E2E_SCENARIOS or model == "server-default":
+    tier = SCENARIO_TIER.get(scenario)
+    if tier:
+        return tier
+    if model == "server-default":
         return "TIER 3: End-to-end /conductor/execute"
     return fallback or "?"
 
 
-def main():
-    if len(sys.argv) > 1 and sys.argv[1] != "-":
-        with open(sys.argv[1]) as f:
-            lines = f.readlines()
-    else:
-        lines = sys.stdin.readlines()
-
+def parse_lines(lines):
+    """Parse eval output in a single pass over any iterable of lines."""
     tiers = []
     current_tier = None
     results = []
@@ -78,15 +108,18 @@ def main():
     for line in lines:
         line = line.rstrip("\n")
 
-        m = TIER_HEADER.match(line)
-        if m:
-            current_tier = m.group(1)
+        m = LINE_RE.match(line)
+        if not m:
+            continue
+
+        if m["tier"] is not None:
+            current_tier = m["tier"]
             tiers.append(current_tier)
             continue
 
-        m = RESULT_LINE.match(line)
-        if m:
-            grade, model, scenario, latency, detail = m.groups()
+        if m["grade"] is not None:
+            grade, model, scenario, latency, detail = m.group(
+                "grade", "model", "scenario", "latency", "detail")
             # Infer tier from scenario name since output interleaves across threads
             tier = infer_tier(model, scenario, current_tier)
             results.append({
@@ -99,14 +132,13 @@ def main():
             })
             continue
 
-        m = SUMMARY_HEADER.match(line)
-        if m:
-            tier_summaries.append({"name": m.group(1)})
+        if m["summary"] is not None:
+            tier_summaries.append({"name": m["summary"]})
             continue
 
-        m = SUMMARY_TOTALS.match(line)
-        if m:
-            total, passed, marginal, fail, avg = m.groups()
+        if m["total"] is not None:
+            total, passed, marginal, fail, avg = m.group(
+                "total", "passed", "marginal", "fail", "avg")
             if tier_summaries:
                 tier_summaries[-1].update({
                     "total": int(total),
@@ -117,9 +149,9 @@ def main():
                 })
             continue
 
-        m = MODEL_SUMMARY.match(line)
-        if m:
-            model, passed, total, avg = m.groups()
+        if m["model_name"] is not None:
+            model, passed, total, avg = m.group(
+                "model_name", "model_pass", "model_total", "model_avg")
             if tier_summaries:
                 key = tier_summaries[-1].get("name", "?")
                 model_summaries[key].append({
@@ -130,24 +162,46 @@ def main():
                 })
             continue
 
-        m = TEST_RESULT.match(line)
-        if m:
-            test_outcomes.append((m.group(1), m.group(2)))
+        if m["test"] is not None:
+            test_outcomes.append((m["test"], m["outcome"]))
             continue
 
+    return tiers, results, tier_summaries, model_summaries, test_outcomes
+
+
+def main():
+    # Iterate the file directly so a large log is never held in memory at once
+    if len(sys.argv) > 1 and sys.argv[1] != "-":
+        with open(sys.argv[1]) as f:
+            tiers, results, tier_summaries, model_summaries, test_outcomes = parse_lines(f)
+    else:
+        tiers, results, tier_summaries, model_summaries, test_outcomes = parse_lines(sys.stdin)
+
+    # ─── Aggregation (one pass over results) ──────────────────────────────────
+
+    by_tier = defaultdict(list)
+    tier_grades = defaultdict(Counter)  # tier -> grade -> count
+    model_grades = defaultdict(Counter)  # model -> grade -> count
+    model_latency = defaultdict(int)  # model -> summed latency_ms
+    cells = {}  # (tier, model, scenario) -> first result for that table cell
+    failures = []
+    marginals = []
+    for r in results:
+        by_tier[r["tier"]].append(r)
+        cells.setdefault((r["tier"], r["model"], r["scenario"]), r)
+        tier_grades[r["tier"]][r["grade"]] += 1
+        model_grades[r["model"]][r["grade"]] += 1
+        model_latency[r["model"]] += r["latency_ms"]
+        if r["grade"] == "FAIL":
+            failures.append(r)
+        elif r["grade"] == "MARGINAL":
+            marginals.append(r)
+
     # ─── Output ───────────────────────────────────────────────────────────────
 
-    # Canonical tier order (output interleaves, so use a fixed ordering)
-    TIER_ORDER = [
-        "TIER 1.1: ConductorBootstrapAgenda",
-        "TIER 1.2: Decide (tool use)",
-        "TIER 1.3: SummarizeChangeset",
-        "TIER 2: Full AgentHarness loop",
-        "TIER 3: End-to-end /conductor/execute",
-    ]
     # Merge discovered tiers with canonical order
-    ordered_tiers = [t for t in TIER_ORDER if t in set(r["tier"] for r in results)]
-    extra = [t for t in tiers if t not in TIER_ORDER and t in set(r["tier"] for r in results)]
+    ordered_tiers = [t for t in TIER_ORDER if t in by_tier]
+    extra = [t for t in tiers if t not in TIER_ORDER and t in by_tier]
     ordered_tiers.extend(extra)
 
     print()
@@ -155,11 +209,6 @@ def main():
     print("  RLM EVALUATION RESULTS")
     print("=" * 80)
 
-    # Group results by tier
-    by_tier = defaultdict(list)
-    for r in results:
-        by_tier[r["tier"]].append(r)
-
     for tier in ordered_tiers:
         tier_results = by_tier.get(tier, [])
         if not tier_results:
@@ -175,45 +224,35 @@ def main():
 
         # Header
         model_col = max(len(m) for m in models) if models else 10
-        print(f"  {'model':<{model_col}}  ", end="")
-        for s in scenarios:
-            print(f"{s[:16]:>16}  ", end="")
-        print(f"{'avg_ms':>8}")
+        row = [f"  {'model':<{model_col}}  "]
+        row.extend(f"{s[:16]:>16}  " for s in scenarios)
+        row.append(f"{'avg_ms':>8}")
+        print("".join(row))
 
-        # Rows
+        # Rows (built up and printed once each rather than cell by cell)
         for model in models:
-            print(f"  {model:<{model_col}}  ", end="")
-            model_results = [r for r in tier_results if r["model"] == model]
+            row = [f"  {model:<{model_col}}  "]
             latencies = []
             for s in scenarios:
-                match = [r for r in model_results if r["scenario"] == s]
-                if match:
-                    r = match[0]
+                r = cells.get((tier, model, s))
+                if r:
                     latencies.append(r["latency_ms"])
-                    symbol = {
-                        "PASS": "  PASS",
-                        "MARGINAL": "  MARG",
-                        "FAIL": " *FAIL",
-                    }.get(r["grade"], "   ???")
+                    symbol = GRADE_SYMBOLS.get(r["grade"], "   ???")
                     cell = f"{symbol} {r['latency_ms']:>5}ms"
-                    print(f"{cell:>16}  ", end="")
+                    row.append(f"{cell:>16}  ")
                 else:
-                    print(f"{'---':>16}  ", end="")
+                    row.append(f"{'---':>16}  ")
             avg = sum(latencies) // len(latencies) if latencies else 0
-            print(f"{avg:>7}ms")
+            row.append(f"{avg:>7}ms")
+            print("".join(row))
 
         # Tier totals
-        tier_pass = sum(1 for r in tier_results if r["grade"] == "PASS")
-        tier_marg = sum(1 for r in tier_results if r["grade"] == "MARGINAL")
-        tier_fail = sum(1 for r in tier_results if r["grade"] == "FAIL")
-        tier_total = len(tier_results)
-        print(f"\n  totals: {tier_pass}/{tier_total} pass, {tier_marg} marginal, {tier_fail} fail")
+        grades = tier_grades[tier]
+        print(f"\n  totals: {grades['PASS']}/{len(tier_results)} pass, "
+              f"{grades['MARGINAL']} marginal, {grades['FAIL']} fail")
 
     # ─── Failure details ──────────────────────────────────────────────────────
 
-    failures = [r for r in results if r["grade"] == "FAIL"]
-    marginals = [r for r in results if r["grade"] == "MARGINAL"]
-
     if failures:
         print(f"\n{'=' * 80}")
         print(f"  FAILURES ({len(failures)})")
@@ -231,27 +270,26 @@ def main():
     # ─── Overall summary ──────────────────────────────────────────────────────
 
     total = len(results)
-    total_pass = sum(1 for r in results if r["grade"] == "PASS")
-    total_marg = sum(1 for r in results if r["grade"] == "MARGINAL")
-    total_fail = sum(1 for r in results if r["grade"] == "FAIL")
+    total_grades = Counter()
+    for grades in tier_grades.values():
+        total_grades.update(grades)
 
     print(f"\n{'=' * 80}")
-    print(f"  OVERALL: {total_pass}/{total} pass, {total_marg} marginal, {total_fail} fail")
+    print(f"  OVERALL: {total_grades['PASS']}/{total} pass, "
+          f"{total_grades['MARGINAL']} marginal, {total_grades['FAIL']} fail")
 
     # Per-model overall
-    all_models = sorted(set(r["model"] for r in results))
-    for model in all_models:
-        mr = [r for r in results if r["model"] == model]
-        mp = sum(1 for r in mr if r["grade"] == "PASS")
-        mt = len(mr)
-        ml = sum(r["latency_ms"] for r in mr) // mt if mt else 0
+    for model in sorted(model_grades):
+        mp = model_grades[model]["PASS"]
+        mt = sum(model_grades[model].values())
+        ml = model_latency[model] // mt if mt else 0
         pct = 100 * mp // mt if mt else 0
         print(f"  {model}: {mp}/{mt} ({pct}%) avg {ml}ms")
 
     # Test runner outcomes
     if test_outcomes:
-        print(f"\n  test runner: {len([t for _, t in test_outcomes if t == 'ok'])} ok, "
-              f"{len([t for _, t in test_outcomes if t == 'FAILED'])} failed")
+        outcomes = Counter(t for _, t in test_outcomes)
+        print(f"\n  test runner: {outcomes['ok']} ok, {outcomes['FAILED']} failed")
 
     print(f"{'=' * 80}")
     print()
@@ -6,14 +6,175 @@ This module provides a high-level interface for managing multiple tmux windows/p
 from a single AI agent, with full support for programmatic control and human visibility.
 """
 
+import codecs
+import functools
+import http.client
+import os
+import selectors
+import shlex
+import shutil
 import subprocess
+import tempfile
+import threading
 import time
 import re
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import ExitStack, contextmanager
 from typing import Optional, List, Dict, Generator
 from dataclasses import dataclass
 from pathlib import Path
 
 
+# Resolved once so each spawn skips the PATH search
+_TMUX = shutil.which("tmux") or "tmux"
+
+# Special key names accepted by send_keys, in tmux format
+_KEY_MAP = {
+    "Enter": "C-m",
+    "Return": "C-m",
+    "Tab": "Tab",
+    "Space": "Space",
+    "C-c": "C-c",
+    "C-d": "C-d",
+    "C-z": "C-z",
+    "C-l": "C-l",
+    "Escape": "Escape",
+}
+
+# Terminal escape sequences (CSI, OSC and two-byte escapes) in raw pane output
+_ANSI_ESCAPE = re.compile(r"\x1b(?:\[[0-?]*[ -/]*[@-~]|\][^\x07\x1b]*(?:\x07|\x1b\\)|[@-Z\\-_])")
+
+
+@functools.lru_cache(maxsize=256)
+def _get_regex(pattern: str, flags: int = re.IGNORECASE) -> re.Pattern:
+    """
+    Compile a pattern once and reuse it across calls.
+    
+    Bounded so caller-supplied patterns can't grow it without limit in a
+    long-running orchestrator.
+    """
+    return re.compile(pattern, flags)
+
+
+def _tmux_literal(text: str) -> str:
+    """Escape text for send-keys -l; tmux reads a trailing ";" as a command separator."""
+    return text[:-1] + "\\;" if text.endswith(";") else text
+
+
+# Words that tmux's command parser leaves alone without quoting
+_CONTROL_SAFE = re.compile(r"[A-Za-z0-9_@%+=:,./-]+")
+
+
+def _control_quote(word: str) -> str:
+    """Quote one argument for tmux's command parser (double quotes, no expansion)."""
+    if _CONTROL_SAFE.fullmatch(word):
+        return word
+    quoted = (word.replace("\\", "\\\\").replace('"', '\\"').replace("$", "\\$")
+              .replace("\n", "\\n").replace("\r", "\\r"))
+    if quoted.startswith("~"):
+        quoted = "\\" + quoted
+    return f'"{quoted}"'
+
+
+def _control_command(args) -> str:
+    """
+    Turn a tmux argv into one command line for a control-mode client.
+    
+    Trailing semicolons keep their argv meaning: ";" (or "x;") separates
+    commands and an escaped "\\;" is a literal semicolon.
+    """
+    words = []
+    for arg in args:
+        if arg.endswith("\\;"):
+            words.append(_control_quote(arg[:-2] + ";"))
+        elif arg.endswith(";"):
+            if arg != ";":
+                words.append(_control_quote(arg[:-1]))
+            words.append(";")
+        else:
+            words.append(_control_quote(arg))
+    return " ".join(words)
+
+
+class _ControlClient:
+    """
+    A long-lived `tmux -C` client that runs commands without spawning tmux.
+    
+    tmux wraps each command's output in %begin and %end (or %error) lines and
+    sends asynchronous %notifications between blocks, which are skipped. A
+    failed command cancels the rest of its line, so every request is followed
+    by a marker command on its own line to show where its output ends.
+    """
+    
+    def __init__(self, session_name: str):
+        self.marker = f"control-marker-{uuid.uuid4().hex}"
+        self.lock = threading.Lock()
+        self.proc = subprocess.Popen(
+            [_TMUX, "-u", "-C", "attach-session", "-t", session_name],
+            stdin=subprocess.PIPE, stdout=subprocess.PIPE, stderr=subprocess.DEVNULL
+        )
+        try:
+            # attach-session answers with the first block
+            self._read_block()
+            # Pane output would otherwise stream back as %output notifications
+            self.run(["refresh-client", "-f", "no-output"])
+        except (OSError, EOFError):
+            self.close()
+            raise
+    
+    def run(self, args) -> subprocess.CompletedProcess:
+        """Run a tmux argv and collect its output like subprocess.run would."""
+        request = f"{_control_command(args)}\ndisplay-message -p {self.marker}\n"
+        stdout = []
+        stderr = []
+        with self.lock:
+            self.proc.stdin.write(request.encode("utf-8"))
+            self.proc.stdin.flush()
+            while True:
+                ok, lines = self._read_block()
+                if ok and lines == [f"{self.marker}\n".encode("utf-8")]:
+                    break
+                (stdout if ok else stderr).extend(lines)
+        
+        return subprocess.CompletedProcess(
+            args, 0 if not stderr else 1,
+            b"".join(stdout).decode("utf-8", "replace"),
+            b"".join(stderr).decode("utf-8", "replace")
+        )
+    
+    def _read_block(self):
+        """Read up to the next %end/%error; returns (succeeded, output lines)."""
+        readline = self.proc.stdout.readline
+        line = readline()
+        while not line.startswith(b"%begin "):
+            if not line:
+                raise EOFError("tmux control client exited")
+            line = readline()
+        
+        guard = line.split(b" ", 1)[1]
+        lines = []
+        while True:
+            line = readline()
+            if not line:
+                raise EOFError("tmux control client exited")
+            if line.startswith((b"%end ", b"%error ")) and line.split(b" ", 1)[1] == guard:
+                return line.startswith(b"%end "), lines
+            lines.append(line)
+    
+    def close(self):
+        """Detach the client; it exits once its stdin closes."""
+        try:
+            self.proc.stdin.close()
+        except OSError:
+            pass
+        try:
+            self.proc.wait(timeout=1)
+        except subprocess.TimeoutExpired:
+            self.proc.kill()
+            self.proc.wait()
+
+
 @dataclass
 class WindowConfig:
     """Configuration for a tmux window."""
@@ -41,26 +202,57 @@ class TerminalSession:
         self.name = name
         self.working_dir = Path(working_dir).expanduser().resolve()
         self.windows: Dict[str, str] = {}  # name -> window_id
+        self._control: Optional[_ControlClient] = None
         self._ensure_session()
+        self._open_control()
+    
+    def _open_control(self):
+        """Attach a control-mode client so later commands skip process startup."""
+        try:
+            self._control = _ControlClient(self.name)
+        except (OSError, EOFError):
+            self._control = None
+    
+    def _close_control(self):
+        if self._control is not None:
+            self._control.close()
+            self._control = None
     
     def _run_tmux(self, *args, capture=True) -> subprocess.CompletedProcess:
-        """Execute a tmux command."""
-        cmd = ["tmux"] + list(args)
+        """
+        Execute a tmux command.
+        
+        Captured commands go over the session's control-mode client when it is
+        up; otherwise (or for interactive commands) a tmux process is spawned.
+        """
+        if capture and self._control is not None:
+            try:
+                return self._control.run(args)
+            except (OSError, EOFError):
+                # The client exits along with its session or server
+                self._close_control()
+        
+        cmd = [_TMUX, *args]
+        # Our fds are non-inheritable already; skipping the close loop lets
+        # Python use posix_spawn, which is much cheaper than fork on macOS
         if capture:
-            return subprocess.run(cmd, capture_output=True, text=True)
+            result = subprocess.run(cmd, capture_output=True, close_fds=False)
+            # Decode once; pane contents may hold invalid UTF-8
+            result.stdout = result.stdout.decode("utf-8", "replace")
+            result.stderr = result.stderr.decode("utf-8", "replace")
+            return result
         else:
-            return subprocess.run(cmd)
+            return subprocess.run(cmd, close_fds=False)
     
     def _ensure_session(self):
         """Create tmux session if it doesn't exist."""
-        # Check if session exists
-        result = self._run_tmux("has-session", "-t", self.name)
-        if result.returncode != 0:
-            # Create new detached session
-            self._run_tmux(
-                "new-session", "-d", "-s", self.name,
-                "-c", str(self.working_dir)
-            )
+        # Create new detached session; if it already exists tmux just reports
+        # a duplicate session and changes nothing, so no has-session check.
+        # (new-session -A would try to attach to our terminal instead.)
+        self._run_tmux(
+            "new-session", "-d", "-s", self.name,
+            "-c", str(self.working_dir)
+        )
     
     def add_window(self, name: str, command: str, 
                    split: bool = False, 
@@ -86,13 +278,14 @@ class TerminalSession:
         
         if split and self.windows:
             # Split the most recently added window
-            last_window = list(self.windows.values())[-1]
+            last_window = next(reversed(self.windows.values()))
             split_flag = "-v" if split_direction == "vertical" else "-h"
-            self._run_tmux("split-window", split_flag, "-t", last_window, "-c", str(target_dir))
-            # Get the new pane ID
-            result = self._run_tmux("list-panes", "-t", self.name, "-F", "#{pane_id}")
-            pane_id = result.stdout.strip().split("\n")[-1]
-            window_id = f"{self.name}:{pane_id}"
+            # -P prints the new pane ID, so no follow-up list-panes is needed
+            result = self._run_tmux("split-window", split_flag, "-t", last_window,
+                                    "-c", str(target_dir), "-P", "-F", "#{pane_id}")
+            # Pane ids are unique server-wide and are only valid targets bare;
+            # "session:%id" is read as a window name and fails to resolve
+            window_id = result.stdout.strip()
         else:
             # Create new window
             self._run_tmux("new-window", "-t", self.name, "-n", name, "-c", str(target_dir))
@@ -102,8 +295,7 @@ class TerminalSession:
         
         # Send the command
         if command:
-            self.send_keys(name, command)
-            self.send_keys(name, "Enter")
+            self.send_lines(name, [command])
         
         return window_id
     
@@ -122,33 +314,43 @@ class TerminalSession:
         window_id = self.windows[window_name]
         
         # Convert special key names to tmux format
-        key_map = {
-            "Enter": "C-m",
-            "Return": "C-m",
-            "Tab": "Tab",
-            "Space": "Space",
-            "C-c": "C-c",
-            "C-d": "C-d",
-            "C-z": "C-z",
-            "C-l": "C-l",
-            "Escape": "Escape",
-        }
-        
-        if keys in key_map:
-            keys = key_map[keys]
+        keys = _KEY_MAP.get(keys, keys)
         
         if literal:
-            # Send literal text character by character
-            for char in keys:
-                if char == " ":
-                    self._run_tmux("send-keys", "-t", window_id, "Space")
-                elif char == "\n":
-                    self._run_tmux("send-keys", "-t", window_id, "Enter")
-                else:
-                    self._run_tmux("send-keys", "-t", window_id, char)
+            # Send each run of text with -l and each newline as Enter, all
+            # chained into a single tmux call
+            args = []
+            for i, run in enumerate(keys.split("\n")):
+                if i:
+                    args += ["send-keys", "-t", window_id, "Enter", ";"]
+                if run:
+                    args += ["send-keys", "-t", window_id, "-l", "--", _tmux_literal(run), ";"]
+            if args:
+                self._run_tmux(*args[:-1])
         else:
             self._run_tmux("send-keys", "-t", window_id, keys)
     
+    def send_lines(self, window_name: str, lines: List[str]):
+        """
+        Type a block of lines into a window and press Enter, in one tmux call.
+        
+        The block is sent literally (no key-name lookup) and chained with the
+        final Enter via tmux's ";" command separator, so a multi-line block
+        costs a single subprocess instead of one per line.
+        
+        Args:
+            window_name: Name of the target window
+            lines: Lines to type; each is submitted in turn
+        """
+        if window_name not in self.windows:
+            raise ValueError(f"Window '{window_name}' not found")
+        
+        window_id = self.windows[window_name]
+        self._run_tmux(
+            "send-keys", "-t", window_id, "-l", "--", _tmux_literal("\n".join(lines)), ";",
+            "send-keys", "-t", window_id, "C-m"
+        )
+    
     def capture_output(self, window_name: str, lines: int = 100) -> str:
         """
         Capture output from a window.
@@ -169,39 +371,214 @@ class TerminalSession:
         result = self._run_tmux("capture-pane", "-t", window_id, "-S", f"-{lines}", "-p")
         return result.stdout
     
+    def capture_many(self, window_names: List[str], lines: int = 100) -> Dict[str, str]:
+        """
+        Capture output from several windows with a single tmux call.
+        
+        Args:
+            window_names: Names of the windows to capture
+            lines: Number of lines to capture per window (from end)
+            
+        Returns:
+            Dictionary mapping window names to captured text output
+        """
+        for window_name in window_names:
+            if window_name not in self.windows:
+                raise ValueError(f"Window '{window_name}' not found")
+        if not window_names:
+            return {}
+        
+        # Chain the captures with ";" and print a per-call marker before each
+        # so the combined output can be split back up by window
+        marker = f"capture-marker-{uuid.uuid4().hex}"
+        args = []
+        for window_name in window_names:
+            args += ["display-message", "-p", marker, ";",
+                     "capture-pane", "-t", self.windows[window_name],
+                     "-S", f"-{lines}", "-p", ";"]
+        result = self._run_tmux(*args[:-1])
+        
+        chunks = result.stdout.split(marker + "\n")[1:]
+        return dict(zip(window_names, chunks))
+    
     def wait_for_pattern(self, window_name: str, pattern: str, 
                         timeout: int = 30, interval: float = 0.5) -> bool:
         """
         Wait for a pattern to appear in window output.
         
+        New output is streamed from the pane with `tmux pipe-pane` and only the
+        new bytes are scanned as they arrive. If the pane is already piped
+        elsewhere this falls back to polling captures every interval.
+        
         Args:
             window_name: Name of the window to monitor
             pattern: Regex pattern to search for
             timeout: Maximum time to wait in seconds
-            interval: Polling interval in seconds
+            interval: Polling interval in seconds (fallback only)
             
         Returns:
             True if pattern found, False if timeout
         """
+        return window_name in self.wait_for_patterns({window_name: pattern},
+                                                     timeout, interval)
+    
+    def wait_for_patterns(self, patterns: Dict[str, str], 
+                          timeout: int = 30, interval: float = 0.5) -> List[str]:
+        """
+        Wait for several windows at once, each for its own pattern.
+        
+        Every window's pipe-pane FIFO is watched by one selector, so the wait
+        ends when the slowest window matches rather than after each in turn.
+        Windows already piped elsewhere are polled every interval instead.
+        
+        Args:
+            patterns: Dictionary mapping window names to regex patterns
+            timeout: Maximum time to wait in seconds, for all windows together
+            interval: Polling interval in seconds (fallback only)
+            
+        Returns:
+            Names of the windows whose pattern was found
+        """
+        for window_name in patterns:
+            if window_name not in self.windows:
+                raise ValueError(f"Window '{window_name}' not found")
+        
+        deadline = time.time() + timeout
+        regexes = {name: _get_regex(pattern) for name, pattern in patterns.items()}
+        found = set()
+        
+        with ExitStack() as stack, selectors.DefaultSelector() as selector:
+            piped = {}
+            polled = []
+            for name in regexes:
+                fd = stack.enter_context(self._pane_pipe(name))
+                if fd is None:
+                    polled.append(name)
+                else:
+                    piped[name] = fd
+            
+            # The pipes are live before this capture, so no output slips between
+            for name, output in self.capture_many(list(regexes)).items():
+                if regexes[name].search(output):
+                    found.add(name)
+            polled = [name for name in polled if name not in found]
+            
+            decoders = {}
+            carry = {}
+            for name, fd in piped.items():
+                if name not in found:
+                    selector.register(fd, selectors.EVENT_READ, name)
+                    decoders[name] = codecs.getincrementaldecoder("utf-8")("replace")
+                    carry[name] = ""
+            
+            next_poll = time.time() + interval
+            while decoders or polled:
+                remaining = deadline - time.time()
+                if remaining <= 0:
+                    break
+                if polled:
+                    remaining = min(remaining, max(0.0, next_poll - time.time()))
+                
+                for key, _ in selector.select(remaining):
+                    name = key.data
+                    text = carry[name] + decoders[name].decode(os.read(key.fd, 65536))
+                    if regexes[name].search(_ANSI_ESCAPE.sub("", text)):
+                        found.add(name)
+                        selector.unregister(key.fd)
+                        del decoders[name]
+                    else:
+                        # Keep the unfinished last line so a match can span reads
+                        carry[name] = text[text.rfind("\n") + 1:][-4096:]
+                
+                if polled and time.time() >= next_poll:
+                    for name, output in self.capture_many(polled).items():
+                        if regexes[name].search(output):
+                            found.add(name)
+                    polled = [name for name in polled if name not in found]
+                    next_poll = time.time() + interval
+        
+        return [name for name in patterns if name in found]
+    
+    @contextmanager
+    def _pane_pipe(self, window_name: str):
+        """
+        Stream a window's raw output into a FIFO for the duration of a block.
+        
+        Yields a non-blocking read fd, or None if the pane already has a pipe
+        (tmux allows one per pane).
+        """
+        window_id = self.windows[window_name]
+        
+        with tempfile.TemporaryDirectory() as tmpdir:
+            fifo = os.path.join(tmpdir, "pane")
+            os.mkfifo(fifo)
+            reader = os.open(fifo, os.O_RDONLY | os.O_NONBLOCK)
+            # Our own writer stops the FIFO reporting EOF before tmux's cat opens it
+            writer = os.open(fifo, os.O_WRONLY)
+            
+            try:
+                # pipe-pane would replace (or with -o, toggle off) an existing
+                # pipe, so only start ours when the pane has none
+                pipe_cmd = (f"pipe-pane -t {shlex.quote(window_id)} "
+                            f"{shlex.quote(f'cat >> {shlex.quote(fifo)}')}")
+                result = self._run_tmux(
+                    "display-message", "-p", "-t", window_id, "#{pane_pipe}", ";",
+                    "if-shell", "-F", "-t", window_id, "#{?pane_pipe,0,1}", pipe_cmd
+                )
+                if result.stdout.strip() != "0":
+                    yield None
+                    return
+                
+                try:
+                    yield reader
+                finally:
+                    self._run_tmux("pipe-pane", "-t", window_id)
+            finally:
+                os.close(writer)
+                os.close(reader)
+    
+    def run_and_wait(self, window_name: str, command: str, timeout: int = 30) -> bool:
+        """
+        Run a command in a window and block until it finishes.
+        
+        The command is wrapped in a brace group and followed by
+        `tmux wait-for -S`, so tmux wakes us when it exits instead of the pane
+        being polled for output. The group is closed on its own line, so a
+        trailing "&" or "# comment" in the command doesn't swallow the signal.
+        The command's exit status is not reported.
+        
+        Args:
+            window_name: Name of the window to run the command in
+            command: Shell command to run
+            timeout: Maximum time to wait in seconds
+            
+        Returns:
+            True if the command finished (whatever its exit status), False if timeout
+        """
         if window_name not in self.windows:
             raise ValueError(f"Window '{window_name}' not found")
         
-        start_time = time.time()
-        regex = re.compile(pattern, re.IGNORECASE)
-        
-        while time.time() - start_time < timeout:
-            output = self.capture_output(window_name)
-            if regex.search(output):
-                return True
-            time.sleep(interval)
+        channel = f"{self.name}-{uuid.uuid4().hex}"
+        self.send_lines(window_name, [
+            f"{{ {command}",
+            f"}}; tmux wait-for -S {shlex.quote(channel)}",
+        ])
         
-        return False
+        try:
+            subprocess.run([_TMUX, "wait-for", channel], timeout=timeout, close_fds=False)
+        except subprocess.TimeoutExpired:
+            return False
+        return True
     
     def wait_for_change(self, window_name: str, 
                        timeout: int = 30, interval: float = 0.5) -> bool:
         """
         Wait for window output to change.
         
+        Each tick compares the pane's scrollback size and cursor position
+        rather than capturing and diffing its contents, so output that
+        rewrites the screen without moving the cursor goes unnoticed.
+        
         Args:
             window_name: Name of the window to monitor
             timeout: Maximum time to wait in seconds
@@ -213,13 +590,20 @@ class TerminalSession:
         if window_name not in self.windows:
             raise ValueError(f"Window '{window_name}' not found")
         
-        initial = self.capture_output(window_name)
+        window_id = self.windows[window_name]
+        
+        def position() -> str:
+            return self._run_tmux(
+                "display-message", "-p", "-t", window_id,
+                "#{history_size}|#{cursor_x}|#{cursor_y}"
+            ).stdout
+        
+        initial = position()
         start_time = time.time()
         
         while time.time() - start_time < timeout:
             time.sleep(interval)
-            current = self.capture_output(window_name)
-            if current != initial:
+            if position() != initial:
                 return True
         
         return False
@@ -239,23 +623,16 @@ class TerminalSession:
         if window_name not in self.windows:
             raise ValueError(f"Window '{window_name}' not found")
         
-        last_output = ""
+        # Track the read position in the pane's history and capture only the
+        # lines completed since the last tick; idle ticks skip capture-pane
+        # until the scrollback fills, after which the tail is compared with
+        # the lines already yielded so an idle pane repeats nothing
+        tail = TailCapture(self)
         
         while True:
-            current = self.capture_output(window_name, lines=1000)
-            
-            # Find new content
-            if current != last_output:
-                # Simple diff - yield new lines
-                last_lines = last_output.split("\n") if last_output else []
-                current_lines = current.split("\n")
-                
-                # Yield lines that are new
-                for line in current_lines[len(last_lines):]:
-                    if line:
-                        yield line
-                
-                last_output = current
+            for line in tail.read(window_name, max_lines=1000).splitlines():
+                if line:
+                    yield line
             
             time.sleep(interval)
     
@@ -270,6 +647,7 @@ class TerminalSession:
     
     def kill(self):
         """Kill the entire session and all windows."""
+        self._close_control()
         self._run_tmux("kill-session", "-t", self.name)
         self.windows.clear()
     
@@ -281,7 +659,7 @@ class TerminalSession:
         )
         
         windows = []
-        for line in result.stdout.strip().split("\n"):
+        for line in result.stdout.splitlines():
             if line:
                 parts = line.split(":")
                 if len(parts) >= 2:
@@ -293,13 +671,62 @@ class TerminalSession:
         
         return windows
     
+    def pane_status(self) -> Dict[str, Dict]:
+        """
+        Get status for every managed window with a single tmux call.
+        
+        Polling loops can compare history_size/cursor_y between ticks to tell
+        which windows produced output, and only capture those.
+        
+        Returns:
+            Dictionary mapping window names to {"pane_id", "active",
+            "history_size", "history_limit", "cursor_y"}
+        """
+        result = self._run_tmux(
+            "list-panes", "-s", "-t", self.name,
+            "-F", "#{pane_id}|#{pane_active}|#{window_active}|#{history_size}|"
+                  "#{history_limit}|#{cursor_y}|#{window_name}"
+        )
+        
+        by_pane = {}
+        by_window = {}
+        for line in result.stdout.splitlines():
+            # Window name goes last so a "|" inside it survives the split
+            parts = line.split("|", 6)
+            if len(parts) < 7:
+                continue
+            (pane_id, pane_active, window_active, history_size,
+             history_limit, cursor_y, window_name) = parts
+            info = {
+                "pane_id": pane_id,
+                "active": window_active == "1" and pane_active == "1",
+                "history_size": int(history_size),
+                "history_limit": int(history_limit),
+                "cursor_y": int(cursor_y),
+            }
+            by_pane[pane_id] = info
+            if pane_active == "1":
+                by_window[window_name] = info
+        
+        # Split panes are tracked by pane id, new windows by window name
+        status = {}
+        for name, window_id in self.windows.items():
+            target = window_id.split(":", 1)[-1]
+            info = by_pane.get(target) if target.startswith("%") else by_window.get(target)
+            if info:
+                status[name] = info
+        return status
+    
     def attach(self):
         """Attach human to the session (blocks until detached)."""
         self._run_tmux("attach", "-t", self.name, capture=False)
     
     def detach(self):
         """Detach from the session."""
+        # detach -s drops every client, so reconnect our own afterwards
+        self._close_control()
         self._run_tmux("detach", "-s", self.name)
+        self._open_control()
     
     def snapshot(self) -> Dict[str, str]:
         """
@@ -308,10 +735,114 @@ class TerminalSession:
         Returns:
             Dictionary mapping window names to their output
         """
-        snapshot = {}
-        for name in self.windows:
-            snapshot[name] = self.capture_output(name)
-        return snapshot
+        # One chained tmux call rather than a capture-pane per window
+        return self.capture_many(list(self.windows))
+
+
+class TailCapture:
+    """
+    Incremental capture of window output.
+    
+    Remembers how far each window's output has been read (scrollback size plus
+    cursor row) and only captures the lines completed since the previous read,
+    skipping capture-pane entirely when nothing changed. Once a window's
+    scrollback fills, tmux trims it and the position no longer tracks output,
+    so reads capture the tail and return only the lines after those already
+    returned; a full pane that repeats its last lines verbatim can't be told
+    from an idle one, so such repeats are missed.
+    """
+    
+    def __init__(self, session: TerminalSession):
+        self.session = session
+        self.positions: Dict[str, int] = {}
+        self.tails: Dict[str, List[str]] = {}
+    
+    def read(self, window_name: str, max_lines: int = 100) -> str:
+        """
+        Get output a window has written since it was last read.
+        
+        Args:
+            window_name: Name of the window to read
+            max_lines: Most lines to return (also the size of the first read)
+            
+        Returns:
+            New complete lines of output, or "" if there are none
+        """
+        if window_name not in self.session.windows:
+            raise ValueError(f"Window '{window_name}' not found")
+        
+        result = self.session._run_tmux(
+            "display-message", "-p", "-t", self.session.windows[window_name],
+            "#{history_size}|#{history_limit}|#{cursor_y}"
+        )
+        history_size, history_limit, cursor_y = (int(v) for v in result.stdout.split("|"))
+        return self._read(window_name, history_size, history_limit, cursor_y, max_lines)
+    
+    def read_all(self, window_names: Optional[List[str]] = None,
+                 max_lines: int = 100) -> Dict[str, str]:
+        """
+        Get new output for several windows using one status query.
+        
+        Args:
+            window_names: Windows to read (default: all windows)
+            max_lines: Most lines to return per window
+            
+        Returns:
+            Dictionary mapping window names to their new output
+        """
+        status = self.session.pane_status()
+        output = {}
+        
+        for name in window_names or list(self.session.windows):
+            info = status.get(name)
+            if info is None:
+                continue
+            output[name] = self._read(name, info["history_size"], info["history_limit"],
+                                      info["cursor_y"], max_lines)
+        
+        return output
+    
+    def _read(self, window_name: str, history_size: int, history_limit: int,
+              cursor_y: int, max_lines: int) -> str:
+        # The cursor row may still be incomplete, so stop just above it
+        position = history_size + cursor_y
+        last = self.positions.get(window_name)
+        self.positions[window_name] = position
+        seen = self.tails.get(window_name, [])
+        
+        # tmux drops a tenth of history-limit whenever the scrollback fills,
+        # so from then on the position wanders and can repeat while output
+        # continues; the tail is captured and compared with the lines already
+        # returned instead
+        full = history_size >= history_limit - max(history_limit // 10, 1)
+        diff = last is not None and (full or last > position)
+        if last is None or diff:
+            start = position - max_lines
+        elif last == position:
+            return ""
+        else:
+            start = max(last, position - max_lines)
+        
+        if start >= position:
+            return ""
+        
+        result = self.session._run_tmux(
+            "capture-pane", "-p", "-t", self.session.windows[window_name],
+            "-S", str(start - history_size), "-E", str(cursor_y - 1)
+        )
+        lines = result.stdout.splitlines()
+        if diff:
+            lines = lines[_overlap(seen, lines):]
+        self.tails[window_name] = (seen + lines)[-max_lines:]
+        return "".join(line + "\n" for line in lines)
+
+
+def _overlap(seen: List[str], lines: List[str]) -> int:
+    """Length of the longest suffix of seen that starts lines."""
+    for size in range(min(len(seen), len(lines)), 0, -1):
+        if seen[-size:] == lines[:size]:
+            return size
+    return 0
 
 
 class MultiServiceOrchestrator:
@@ -327,7 +858,9 @@ class MultiServiceOrchestrator:
     
     def add_service(self, name: str, command: str, 
                    working_dir: Optional[str] = None,
-                   ready_pattern: Optional[str] = None):
+                   ready_pattern: Optional[str] = None,
+                   health_port: Optional[int] = None,
+                   health_path: str = "/health"):
         """
         Add a service to orchestrate.
         
@@ -336,41 +869,82 @@ class MultiServiceOrchestrator:
             command: Command to run
             working_dir: Optional override for working directory
             ready_pattern: Pattern to wait for indicating service is ready
+            health_port: Local port whose HTTP health endpoint signals ready
+                (checked instead of ready_pattern when set)
+            health_path: Path of the health endpoint
         """
-        window_id = self.session.add_window(name, command, working_dir=working_dir)
+        # The shell signals this channel as it runs the command, so start_all()
+        # can block on tmux instead of sleeping
+        started_channel = f"{self.session.name}-{name}-{uuid.uuid4().hex}"
+        window_id = self.session.add_window(
+            name, f"tmux wait-for -S {started_channel}; {command}", working_dir=working_dir
+        )
         self.services[name] = {
             "command": command,
             "window_id": window_id,
+            "started_channel": started_channel,
+            "started": False,
             "ready_pattern": ready_pattern,
+            "health_port": health_port,
+            "health_path": health_path,
             "ready": False
         }
     
     def start_all(self, stagger: float = 1.0):
         """
-        Start all services with optional stagger delay.
+        Wait until every service's command has actually started.
+        
+        Services are launched by add_service; each one's shell signals a tmux
+        wait-for channel as it runs the command, so this returns as soon as
+        the shells are up rather than after a fixed sleep per service.
         
         Args:
-            stagger: Seconds to wait between starting services
+            stagger: Most seconds to wait for each service to start
         """
-        for name in self.services:
-            # Service already started by add_service, just wait
-            time.sleep(stagger)
+        for config in self.services.values():
+            if config["started"]:
+                continue
+            try:
+                subprocess.run([_TMUX, "wait-for", config["started_channel"]],
+                               timeout=stagger, close_fds=False)
+                config["started"] = True
+            except subprocess.TimeoutExpired:
+                pass
     
     def wait_for_ready(self, timeout_per_service: int = 30) -> List[str]:
         """
-        Wait for all services with ready patterns to signal ready.
+        Wait for all services with health endpoints or ready patterns to signal ready.
+        
+        Services are checked concurrently, so the total wait is the slowest
+        startup rather than the sum of all of them. Health endpoints are
+        polled from worker threads while every ready pattern is watched by a
+        single wait_for_patterns() call.
         
         Returns:
             List of service names that became ready
         """
-        ready = []
+        health = {name: config for name, config in self.services.items()
+                  if config["health_port"]}
+        patterns = {name: config["ready_pattern"] for name, config in self.services.items()
+                    if not config["health_port"] and config["ready_pattern"]}
+        if not health and not patterns:
+            return []
         
-        for name, config in self.services.items():
-            if config["ready_pattern"]:
-                if self.session.wait_for_pattern(name, config["ready_pattern"], 
-                                                timeout=timeout_per_service):
-                    config["ready"] = True
-                    ready.append(name)
+        matched = []
+        with ThreadPoolExecutor(max_workers=max(len(health), 1)) as executor:
+            futures = {
+                name: executor.submit(wait_for_http, "127.0.0.1", config["health_port"],
+                                      config["health_path"], timeout=timeout_per_service)
+                for name, config in health.items()
+            }
+            if patterns:
+                matched = self.session.wait_for_patterns(patterns, timeout=timeout_per_service)
+        
+        ready = []
+        for name in self.services:
+            if name in matched or (name in futures and futures[name].result()):
+                self.services[name]["ready"] = True
+                ready.append(name)
         
         return ready
     
@@ -382,21 +956,41 @@ class MultiServiceOrchestrator:
             patterns: List of regex patterns to search for (default: ["ERROR", "FATAL"])
             
         Returns:
-            Dictionary mapping service names to list of matched lines
+            Dictionary mapping service names to list of matched lines (each
+            line once, in output order)
         """
         if patterns is None:
             patterns = ["ERROR", "FATAL", "CRASH", "Exception"]
         
+        # One alternation searched across the whole capture; MULTILINE keeps
+        # ^/$ anchored to line boundaries as if each line were searched alone
+        combined = _get_regex(
+            "|".join(f"(?:{pattern})" for pattern in patterns),
+            re.IGNORECASE | re.MULTILINE,
+        )
         matches = {}
         
+        # Every service's pane comes back from one chained tmux command
+        outputs = self.session.capture_many(list(self.services), lines=100)
+        
         for name in self.services:
-            output = self.session.capture_output(name, lines=100)
-            matches[name] = []
+            output = outputs.get(name, "")
+            found = matches[name] = []
             
-            for pattern in patterns:
-                for line in output.split("\n"):
-                    if re.search(pattern, line, re.IGNORECASE):
-                        matches[name].append(line)
+            pos = 0
+            while True:
+                m = combined.search(output, pos)
+                if m is None:
+                    break
+                line_start = output.rfind("\n", 0, m.start()) + 1
+                line_end = output.find("\n", m.start())
+                if line_end == -1:
+                    line_end = len(output)
+                found.append(output[line_start:line_end])
+                # Resume on the next line so each line is reported once
+                pos = line_end + 1
+                if pos > len(output):
+                    break
         
         return matches
     
@@ -418,6 +1012,47 @@ class MultiServiceOrchestrator:
 
 # Convenience functions for quick usage
 
+def wait_for_http(host: str, port: int, path: str = "/health",
+                  timeout: float = 30) -> bool:
+    """
+    Wait for an HTTP endpoint to answer 200.
+    
+    Probes back off from 25ms up to 1s over a single reused connection, so a
+    fast-starting service is noticed almost immediately.
+    
+    Args:
+        host: Host to connect to
+        port: Port to connect to
+        path: Request path of the health endpoint
+        timeout: Maximum time to wait in seconds
+        
+    Returns:
+        True if the endpoint answered 200, False if timeout
+    """
+    conn = http.client.HTTPConnection(host, port, timeout=0.5)
+    deadline = time.time() + timeout
+    delay = 0.025
+    
+    try:
+        while True:
+            try:
+                conn.request("GET", path)
+                response = conn.getresponse()
+                response.read()
+                if response.status == 200:
+                    return True
+            except (OSError, http.client.HTTPException):
+                # Refused or dropped; the next request reconnects
+                conn.close()
+            
+            if time.time() + delay > deadline:
+                return False
+            time.sleep(delay)
+            delay = min(delay * 1.5, 1.0)
+    finally:
+        conn.close()
+
+
 def quick_session(name: str, commands: Dict[str, str], working_dir: str = ".") -> TerminalSession:
     """
     Quickly create a session with multiple windows.
@@ -12,7 +12,7 @@ Then you can attach to monitor them.
 import sys
 sys.path.insert(0, '/Users/wiz/choiros-rs/skills/multi-terminal/scripts')
 
-from terminal_session import TerminalSession
+from terminal_session import TerminalSession, TailCapture
 import time
 
 def main():
@@ -31,11 +31,12 @@ def main():
     time.sleep(2)
     
     # Check initial output
+    tail = TailCapture(session)
     print("\n--- Sandbox output (first 20 lines) ---")
-    print(session.capture_output("sandbox", lines=20))
+    print(tail.read("sandbox", max_lines=20))
     
     print("\n--- UI output (first 20 lines) ---")
-    print(session.capture_output("ui", lines=20))
+    print(tail.read("ui", max_lines=20))
     
     print("\n✅ Both services started!")
     print("\nCommands you can run:")
@@ -52,11 +53,10 @@ def main():
     try:
         for i in range(10):
             time.sleep(1)
-            # Quick check for errors
-            sandbox_out = session.capture_output("sandbox", lines=5)
-            ui_out = session.capture_output("ui", lines=5)
+            # Quick check for errors in whatever was printed since last tick
+            new_output = tail.read_all(["sandbox", "ui"])
             
-            if "error" in sandbox_out.lower() or "error" in ui_out.lower():
+            if any("error" in out.lower() for out in new_output.values()):
                 print(f"⚠️  Potential error detected at second {i}!")
                 
     except KeyboardInterrupt:
@@ -12,34 +12,151 @@ Analyzes:
 Usage:
     python check_staleness.py <handoff-file>
     python check_staleness.py docs/handoffs/2024-01-15-143022-auth.md
+    python check_staleness.py --all [project-path]   # every handoff in docs/handoffs/
 """
 
+import functools
 import os
 import re
 import subprocess
 import sys
+import threading
+import time
+from collections.abc import Iterator
 from datetime import datetime
 from pathlib import Path
 
+try:
+    import pygit2  # Optional: in-process git access without forking
+except ImportError:
+    pygit2 = None
 
-def run_cmd(cmd: list[str], cwd: str = None) -> tuple[bool, str]:
-    """Run a command and return (success, output)."""
+# Handoff metadata patterns
+META_RE = re.compile(r'(Created|Branch|Project):\s*(.*)')
+CREATED_VALUE_RE = re.compile(r'\d{4}-\d{2}-\d{2}\s+\d{2}:\d{2}:\d{2}')
+TABLE_FILE_RE = re.compile(r'\|\s*([a-zA-Z0-9_\-./]+\.[a-zA-Z]+)\s*\|')
+
+
+# Above this many referenced files, one `git ls-files` beats a stat per file
+LS_FILES_THRESHOLD = 20
+
+# Total seconds all git calls in one process may take; shared across handoffs
+GIT_BUDGET_SECONDS = 30
+
+
+class Budget:
+    """A deadline shared by a series of commands.
+
+    Each command gets whatever time is left rather than a fresh per-call
+    timeout, so a sweep over many handoffs is bounded as a whole. After the
+    first timeout the budget is marked exhausted and later commands are
+    skipped instead of each waiting out the clock again.
+    """
+
+    def __init__(self, total: float):
+        self.deadline = time.monotonic() + total
+        self.exhausted = False
+
+    def remaining(self) -> float:
+        """Seconds left before the deadline (0 once exhausted)."""
+        if not self.exhausted and time.monotonic() >= self.deadline:
+            self.exhausted = True
+        if self.exhausted:
+            return 0.0
+        return max(0.0, self.deadline - time.monotonic())
+
+
+@functools.lru_cache(maxsize=None)
+def get_git_budget() -> Budget:
+    """Return the process-wide git budget, starting its clock on first use."""
+    return Budget(GIT_BUDGET_SECONDS)
+
+
+def run_cmd(
+    cmd: list[str],
+    cwd: str = None,
+    budget: Budget | None = None,
+    text: bool = True
+) -> tuple[bool, str | bytes]:
+    """Run a command and return (success, output).
+
+    Without a budget the command gets a 10s timeout of its own. With
+    text=False the raw stdout bytes are returned, unstripped, for
+    NUL-separated (-z) output.
+    """
+    empty = "" if text else b""
+    timeout = budget.remaining() if budget else 10
+    if timeout <= 0:
+        return False, empty
     try:
         result = subprocess.run(
             cmd,
             capture_output=True,
-            text=True,
+            text=text,
             cwd=cwd,
-            timeout=10
+            timeout=timeout
         )
-        return result.returncode == 0, result.stdout.strip()
-    except (subprocess.TimeoutExpired, FileNotFoundError):
-        return False, ""
+        output = result.stdout.strip() if text else result.stdout
+        return result.returncode == 0, output
+    except subprocess.TimeoutExpired:
+        if budget:
+            budget.exhausted = True
+        return False, empty
+    except FileNotFoundError:
+        return False, empty
+
+
+def stream_cmd(
+    cmd: list[str],
+    cwd: str = None,
+    budget: Budget | None = None,
+    sep: bytes = b"\n"
+) -> Iterator[bytes]:
+    """Yield a command's stdout as sep-delimited byte records, without buffering it whole.
+
+    Raises subprocess.CalledProcessError on a non-zero exit and
+    subprocess.TimeoutExpired if the command outlives its timeout (the
+    budget's remaining time, or 10s without one).
+    """
+    timeout = budget.remaining() if budget else 10
+    if timeout <= 0:
+        raise subprocess.TimeoutExpired(cmd, 0)
+
+    proc = subprocess.Popen(
+        cmd,
+        stdout=subprocess.PIPE,
+        stderr=subprocess.DEVNULL,
+        cwd=cwd
+    )
+    timed_out = threading.Event()
+
+    def kill():
+        timed_out.set()
+        proc.kill()
+
+    timer = threading.Timer(timeout, kill)
+    timer.start()
+    try:
+        with proc:
+            pending = b""
+            for chunk in iter(lambda: proc.stdout.read1(65536), b""):
+                *records, pending = (pending + chunk).split(sep)
+                yield from records
+            if pending:
+                yield pending
+    finally:
+        timer.cancel()
+
+    if timed_out.is_set():
+        if budget:
+            budget.exhausted = True
+        raise subprocess.TimeoutExpired(cmd, timeout)
+    if proc.returncode != 0:
+        raise subprocess.CalledProcessError(proc.returncode, cmd)
 
 
 def parse_handoff_metadata(filepath: str) -> dict:
-    """Extract metadata from a handoff file."""
-    content = Path(filepath).read_text()
+    """Extract metadata from a handoff file in a single pass over its lines."""
     metadata = {
         "created": None,
         "branch": None,
@@ -47,92 +164,319 @@ def parse_handoff_metadata(filepath: str) -> dict:
         "modified_files": [],
     }
 
-    # Parse Created timestamp
-    match = re.search(r'Created:\s*(\d{4}-\d{2}-\d{2}\s+\d{2}:\d{2}:\d{2})', content)
-    if match:
-        try:
-            metadata["created"] = datetime.strptime(match.group(1), "%Y-%m-%d %H:%M:%S")
-        except ValueError:
-            pass
-
-    # Parse Branch
-    match = re.search(r'Branch:\s*(\S+)', content)
-    if match:
-        branch = match.group(1)
-        if branch and not branch.startswith('['):
-            metadata["branch"] = branch
-
-    # Parse Project path
-    match = re.search(r'Project:\s*(.+?)(?:\n|$)', content)
-    if match:
-        metadata["project_path"] = match.group(1).strip()
-
-    # Parse modified files from table
-    table_matches = re.findall(r'\|\s*([a-zA-Z0-9_\-./]+\.[a-zA-Z]+)\s*\|', content)
-    for f in table_matches:
-        if '/' in f and not f.startswith('['):
-            metadata["modified_files"].append(f)
+    # Scalar fields take their first valid occurrence; once all are found,
+    # only table rows are still of interest
+    pending = {"Created", "Branch", "Project"}
+
+    with open(filepath) as f:
+        for line in f:
+            # Parse modified files from table rows
+            if "|" in line:
+                for name in TABLE_FILE_RE.findall(line):
+                    if '/' in name and not name.startswith('['):
+                        metadata["modified_files"].append(name)
+
+            if not pending or ":" not in line:
+                continue
+
+            for match in META_RE.finditer(line):
+                key, value = match.groups()
+                if key not in pending:
+                    continue
+
+                if key == "Created":
+                    # Parse Created timestamp
+                    created = CREATED_VALUE_RE.match(value)
+                    if not created:
+                        continue
+                    try:
+                        metadata["created"] = datetime.strptime(
+                            created.group(0), "%Y-%m-%d %H:%M:%S"
+                        )
+                    except ValueError:
+                        pass
+                elif key == "Branch":
+                    # Parse Branch
+                    if not value.strip():
+                        continue
+                    branch = value.split()[0]
+                    if not branch.startswith('['):
+                        metadata["branch"] = branch
+                else:
+                    # Parse Project path
+                    if not value.strip():
+                        continue
+                    metadata["project_path"] = value.strip()
+
+                pending.discard(key)
 
     return metadata
 
 
-def get_commits_since(timestamp: datetime, project_path: str) -> list[str]:
-    """Get list of commits since a given timestamp."""
-    if not timestamp:
-        return []
+def read_current_branch(project_path: str) -> str | None:
+    """Read the current branch from .git/HEAD without spawning git.
 
-    iso_time = timestamp.strftime("%Y-%m-%dT%H:%M:%S")
-    success, output = run_cmd(
-        ["git", "log", f"--since={iso_time}", "--oneline", "--no-decorate"],
-        cwd=project_path
-    )
+    Returns None when HEAD is detached or .git is not a plain directory
+    (worktrees, subdirectories), so the caller can ask git instead.
+    """
+    head_file = Path(project_path) / ".git" / "HEAD"
+    try:
+        head = head_file.read_text().strip()
+    except OSError:
+        return None
 
-    if success and output:
-        return output.split("\n")
-    return []
+    if head.startswith("ref: refs/heads/"):
+        return head[len("ref: refs/heads/"):]
+    return None
 
 
-def get_current_branch(project_path: str) -> str | None:
-    """Get current git branch."""
-    success, branch = run_cmd(
-        ["git", "branch", "--show-current"],
-        cwd=project_path
-    )
-    return branch if success else None
+class GitHelper:
+    """Git state for one repository, shared across staleness checks.
 
+    Repo detection and the current branch are resolved once. History is
+    fetched with a single `git log` (or an in-process pygit2 walk) reaching
+    back to the oldest timestamp requested so far; checks against newer
+    handoffs filter the cached commits instead of spawning git again.
+    """
 
-def get_changed_files_since(timestamp: datetime, project_path: str) -> list[str]:
-    """Get files that changed since timestamp."""
-    if not timestamp:
-        return []
+    def __init__(self, project_path: str, budget: Budget | None = None):
+        self.project_path = project_path
+        self.budget = budget
+        self.is_git_repo = None  # Unknown until the first query
+        self._branch = None
+        self._branch_loaded = False
+        self._since = None
+        self._history = []  # (commit_time, "<hash> <subject>", [file bytes]), newest first
+        self._repo = None
+        self._worktree_files = None  # Snapshot from snapshot_worktree_files()
+
+        if pygit2 is not None:
+            try:
+                self._repo = pygit2.Repository(project_path)
+                self.is_git_repo = True
+            except pygit2.GitError:
+                self.is_git_repo = False
+
+    def check_repo(self) -> bool:
+        """Return whether project_path is inside a git repository."""
+        if self.is_git_repo is None:
+            # Reading .git/HEAD settles it without a subprocess; else probes
+            self.current_branch()
+        if self.is_git_repo is None:
+            self._probe()
+        return self.is_git_repo
+
+    def current_branch(self) -> str | None:
+        """Return the checked-out branch ("" when detached)."""
+        if not self._branch_loaded:
+            if self._repo is not None and not self._repo.head_is_unborn:
+                # Match `git branch --show-current`, which prints nothing when detached
+                self._branch = "" if self._repo.head_is_detached else self._repo.head.shorthand
+                self._branch_loaded = True
+            else:
+                branch = read_current_branch(self.project_path)
+                if branch is None:
+                    self._probe()
+                else:
+                    # A .git/HEAD naming a branch is as good as the rev-parse probe
+                    if self.is_git_repo is None:
+                        self.is_git_repo = True
+                    self._branch = branch
+                    self._branch_loaded = True
+        return self._branch
+
+    def _probe(self):
+        """Resolve repo presence and branch with one `git rev-parse`."""
+        success, output = run_cmd([
+            "git", "-C", self.project_path, "rev-parse",
+            "--is-inside-work-tree", "--abbrev-ref", "HEAD",
+        ], budget=self.budget)
+        # An unborn HEAD fails the --abbrev-ref lookup but still prints "true"
+        lines = output.split("\n")
+        self.is_git_repo = lines[0] == "true"
+        if not self._branch_loaded:
+            if success and len(lines) > 1:
+                self._branch = "" if lines[1] == "HEAD" else lines[1]
+            else:
+                self._branch = read_current_branch(self.project_path)
+            self._branch_loaded = True
+
+    def history_since(self, timestamp: datetime) -> list[tuple[float, str, list[bytes]]]:
+        """Return (commit_time, header, files) for commits since timestamp.
+
+        Raises subprocess.TimeoutExpired if git history is needed but the
+        budget runs (or has already run) out.
+        """
+        if self._since is None or timestamp < self._since:
+            self._load_history(timestamp)
+        cutoff = timestamp.timestamp()
+        return [entry for entry in self._history if entry[0] >= cutoff]
+
+    def snapshot_worktree_files(self):
+        """List every tracked, present file once for later membership checks.
+
+        Worth it when many handoffs will be checked against the same tree.
+        """
+        self._worktree_files = self._ls_files([])
+
+    def tracked_in_worktree(self, paths: list[str]) -> set[str]:
+        """Return the paths that are tracked and present in the working tree."""
+        if self._worktree_files is not None:
+            return self._worktree_files.intersection(paths)
+        return self._ls_files(paths)
+
+    def has_worktree_snapshot(self) -> bool:
+        return self._worktree_files is not None
+
+    def _ls_files(self, paths: list[str]) -> set[str]:
+        # Entries tagged "H" are in the index; "R" marks those deleted from
+        # the working tree
+        success, output = run_cmd([
+            "git", "-C", self.project_path, "ls-files", "-z", "-t",
+            "--cached", "--deleted", "--", *paths,
+        ], budget=self.budget, text=False)
+        if not success:
+            return set()
+
+        tracked, deleted = set(), set()
+        for entry in output.split(b"\x00"):
+            tag, _, name = entry.partition(b" ")
+            if tag == b"H":
+                tracked.add(name)
+            elif tag == b"R":
+                deleted.add(name)
+        # Decode like the filesystem does, so names compare with handoff paths
+        return {os.fsdecode(name) for name in tracked - deleted}
+
+    def _load_history(self, timestamp: datetime):
+        if self._repo is not None:
+            self._history = self._walk_pygit2(timestamp)
+            self._since = timestamp
+            return
+
+        iso_time = timestamp.strftime("%Y-%m-%dT%H:%M:%S")
+        cmd = [
+            "git", "-C", self.project_path, "log", "-z", f"--since={iso_time}",
+            "--name-only", "--pretty=format:%x1e%ct %h %s",
+        ]
+
+        # With -z every file name is NUL-terminated, so names may contain any
+        # byte. Each commit's record starts with a \x1e-marked
+        # "<ctime> <hash> <subject>" header, joined to its first file by a
+        # newline. File names stay bytes; only the ones displayed get decoded.
+        history = []
+        try:
+            for record in stream_cmd(cmd, budget=self.budget, sep=b"\x00"):
+                if record.startswith(b"\x1e"):
+                    header, _, first_file = record[1:].partition(b"\n")
+                    commit_time, header = header.decode("utf-8", "replace").split(" ", 1)
+                    files = [first_file] if first_file else []
+                    history.append((float(commit_time), header, files))
+                elif record and history:
+                    files.append(record)
+        except subprocess.TimeoutExpired:
+            # An empty history would read as "nothing changed"; let callers know
+            raise
+        except (subprocess.SubprocessError, FileNotFoundError):
+            # Could be an unborn HEAD rather than no repo; check_repo() decides
+            return
+
+        self.is_git_repo = True
+        self._history = history
+        self._since = timestamp
+
+    def _walk_pygit2(self, timestamp: datetime) -> list[tuple[float, str, list[bytes]]]:
+        repo = self._repo
+        if repo.head_is_unborn:
+            return []
+
+        history = []
+        since = timestamp.timestamp()
+        for commit in repo.walk(repo.head.target, pygit2.GIT_SORT_TIME):
+            if commit.commit_time < since:
+                break
+            subject = commit.message.split("\n", 1)[0]
+
+            # Like `git log --name-only`: root commits list every file, merges none
+            if not commit.parents:
+                diff = commit.tree.diff_to_tree(swap=True)
+            elif len(commit.parents) == 1:
+                diff = repo.diff(commit.parents[0].tree, commit.tree)
+            else:
+                diff = None
+            files = [delta.new_file.raw_path for delta in diff.deltas] if diff else []
+            history.append((commit.commit_time, f"{commit.short_id} {subject}", files))
+        return history
 
-    iso_time = timestamp.strftime("%Y-%m-%dT%H:%M:%S")
-    success, output = run_cmd(
-        ["git", "diff", "--name-only", f"--since={iso_time}", "HEAD"],
-        cwd=project_path
-    )
 
-    # Fallback: get files changed in commits since timestamp
-    if not output:
-        success, output = run_cmd(
-            ["git", "log", f"--since={iso_time}", "--name-only", "--pretty=format:"],
-            cwd=project_path
-        )
+@functools.lru_cache(maxsize=32)
+def get_git_helper(project_path: str) -> GitHelper:
+    """Return the shared GitHelper for a project, creating it on first use.
+
+    Handoffs in one project all resolve to the same path, so checking many of
+    them in one process detects the repo and reads the branch only once.
+    """
+    return GitHelper(project_path, get_git_budget())
 
-    if success and output:
-        files = [f.strip() for f in output.split("\n") if f.strip()]
-        return list(set(files))  # Deduplicate
-    return []
 
+def gather_git_state(
+    project_path: str,
+    timestamp: datetime | None,
+    git: GitHelper | None = None
+) -> dict:
+    """Collect commits and changed files since timestamp.
 
-def check_files_exist(files: list[str], project_path: str) -> tuple[list[str], list[str]]:
-    """Check which files from handoff still exist."""
+    Uses the process-wide helper for project_path unless one is passed in.
+    "timed_out" is set when the history couldn't be read within the git time
+    budget, in which case the commit and file lists are empty but not real.
+    """
+    if git is None:
+        git = get_git_helper(project_path)
+
+    state = {
+        "is_git_repo": False,
+        "current_branch": None,
+        "commits": [],
+        "changed_files": set(),
+        "timed_out": False,
+    }
+
+    try:
+        history = git.history_since(timestamp) if timestamp else []
+    except subprocess.TimeoutExpired:
+        state["timed_out"] = True
+        history = []
+    if not git.check_repo():
+        return state
+
+    state["is_git_repo"] = True
+    state["current_branch"] = git.current_branch()
+    for _, header, files in history:
+        state["commits"].append(header)
+        state["changed_files"].update(files)
+
+    return state
+
+
+def check_files_exist(
+    files: list[str],
+    project_path: str,
+    git: GitHelper | None = None
+) -> tuple[list[str], list[str]]:
+    """Check which files from handoff still exist.
+
+    For long lists, tracked files are confirmed with a single `git ls-files`
+    and only the rest (untracked or unnormalised paths) are stat'ed.
+    """
     existing = []
     missing = []
 
+    present = set()
+    if git is not None and (git.has_worktree_snapshot() or len(files) > LS_FILES_THRESHOLD):
+        present = git.tracked_in_worktree(files)
+
     for f in files:
-        full_path = Path(project_path) / f
-        if full_path.exists():
+        if f in present or os.path.exists(os.path.join(project_path, f)):
             existing.append(f)
         else:
             missing.append(f)
@@ -223,7 +567,9 @@ def check_staleness(handoff_path: str) -> dict:
     """Run staleness check on a handoff file."""
     path = Path(handoff_path)
 
-    if not path.exists():
+    try:
+        stat = os.stat(handoff_path)
+    except OSError:
         return {"error": f"Handoff file not found: {handoff_path}"}
 
     # Parse handoff
@@ -236,9 +582,12 @@ def check_staleness(handoff_path: str) -> dict:
         # docs/handoffs/ -> docs/ -> project root
         project_path = str(path.parent.parent)
 
-    # Check if git repo
-    success, _ = run_cmd(["git", "rev-parse", "--git-dir"], cwd=project_path)
-    is_git_repo = success
+    # Repo detection and branch are cheap (usually no subprocess at all).
+    # The helper is keyed on the resolved path, so "." and the absolute
+    # Project: path share one
+    git = get_git_helper(os.path.realpath(project_path))
+    current_branch = git.current_branch()
+    is_git_repo = git.check_repo()
 
     result = {
         "handoff_file": str(path),
@@ -248,56 +597,143 @@ def check_staleness(handoff_path: str) -> dict:
         "handoff_branch": metadata["branch"],
     }
 
-    # Calculate age
+    # Calculate age, falling back to file mtime when Created: is missing
     if metadata["created"]:
-        age = datetime.now() - metadata["created"]
-        result["days_old"] = age.total_seconds() / 86400
-        result["hours_old"] = age.total_seconds() / 3600
+        age_seconds = (datetime.now() - metadata["created"]).total_seconds()
+        result["age_source"] = "created"
     else:
-        result["days_old"] = None
-        result["hours_old"] = None
+        age_seconds = time.time() - stat.st_mtime
+        result["age_source"] = "mtime"
+    result["days_old"] = age_seconds / 86400
+    result["hours_old"] = age_seconds / 3600
 
     if is_git_repo:
         # Git-based checks
-        result["current_branch"] = get_current_branch(project_path)
+        result["current_branch"] = current_branch
         result["branch_matches"] = (
-            result["current_branch"] == metadata["branch"]
+            current_branch == metadata["branch"]
             if metadata["branch"] else True
         )
 
-        commits = get_commits_since(metadata["created"], project_path)
-        result["commits_since"] = len(commits)
-        result["recent_commits"] = commits[:5]  # Show first 5
-
-        changed_files = get_changed_files_since(metadata["created"], project_path)
-        result["files_changed_count"] = len(changed_files)
-        result["files_changed"] = changed_files[:10]  # Show first 10
-
-        # Check if handoff's modified files still exist
-        existing, missing = check_files_exist(metadata["modified_files"], project_path)
-        result["referenced_files_exist"] = len(existing)
-        result["referenced_files_missing"] = missing
-
-        # Calculate staleness
+        # Age and branch alone may already reach VERY_STALE; the remaining
+        # factors only add to the score, so the history walk can be skipped
         level, recommendation, issues = calculate_staleness_level(
-            result.get("days_old", 0) or 0,
-            result["commits_since"],
-            result["files_changed_count"],
-            result["branch_matches"],
-            len(missing)
+            result["days_old"], 0, 0, result["branch_matches"], 0
         )
+        result["history_skipped"] = level == "VERY_STALE"
+
+        git_state = None
+        if not result["history_skipped"]:
+            git_state = gather_git_state(project_path, metadata["created"], git)
+        result["history_timed_out"] = git_state is not None and git_state["timed_out"]
+
+        if result["history_timed_out"]:
+            # Zero commits and files would score as unchanged; don't guess
+            level = "UNKNOWN"
+            recommendation = "Git timed out - unable to detect changes"
+            issues = ["Git commands exceeded the time budget"]
+
+        if git_state is None or result["history_timed_out"]:
+            result["commits_since"] = None
+            result["recent_commits"] = []
+            result["files_changed_count"] = None
+            result["files_changed"] = []
+            result["referenced_files_exist"] = None
+            result["referenced_files_missing"] = []
+        else:
+            commits = git_state["commits"]
+            result["commits_since"] = len(commits)
+            result["recent_commits"] = commits[:5]  # Show first 5
+
+            changed_files = sorted(git_state["changed_files"])
+            result["files_changed_count"] = len(changed_files)
+            result["files_changed"] = [  # Show first 10
+                name.decode("utf-8", "replace") for name in changed_files[:10]
+            ]
+
+            # Check if handoff's modified files still exist
+            existing, missing = check_files_exist(metadata["modified_files"], project_path, git)
+            result["referenced_files_exist"] = len(existing)
+            result["referenced_files_missing"] = missing
+
+            # Calculate staleness
+            level, recommendation, issues = calculate_staleness_level(
+                result["days_old"],
+                result["commits_since"],
+                result["files_changed_count"],
+                result["branch_matches"],
+                len(missing)
+            )
+
         result["staleness_level"] = level
         result["recommendation"] = recommendation
         result["issues"] = issues
     else:
         # Non-git checks (limited)
         result["staleness_level"] = "UNKNOWN"
-        result["recommendation"] = "Not a git repo - unable to detect changes"
-        result["issues"] = ["Project is not a git repository"]
+        if get_git_budget().exhausted:
+            result["recommendation"] = "Git timed out - unable to detect changes"
+            result["issues"] = ["Git commands exceeded the time budget"]
+        else:
+            result["recommendation"] = "Not a git repo - unable to detect changes"
+            result["issues"] = ["Project is not a git repository"]
 
     return result
 
 
+def check_all(project_path: str) -> list[dict]:
+    """Run staleness checks on every handoff in a project's docs/handoffs/.
+
+    All checks share one GitHelper: the branch is read once, the working-tree
+    file list is snapshotted once, and handoffs are checked oldest first so
+    the first history walk already covers every later handoff.
+    """
+    project_path = str(Path(project_path))
+    handoffs_dir = Path(project_path) / "docs" / "handoffs"
+
+    try:
+        with os.scandir(handoffs_dir) as entries:
+            names = [
+                entry.name for entry in entries
+                if entry.name.endswith(".md") and not entry.is_dir()
+            ]
+    except OSError:
+        return []
+
+    # Same key as check_staleness() uses, so its checks reuse this helper
+    git = get_git_helper(os.path.realpath(project_path))
+    if git.check_repo():
+        git.snapshot_worktree_files()
+
+    # Filenames start with their creation timestamp, so name order is age order
+    results = [check_staleness(str(handoffs_dir / name)) for name in sorted(names)]
+
+    # Report most recent first, like list_handoffs.py
+    results.reverse()
+    return results
+
+
+def print_summary(results: list[dict]):
+    """Print a one-line-per-handoff staleness summary."""
+    print(f"\n{'='*60}")
+    print(f"Handoff Staleness Summary ({len(results)} handoffs)")
+    print(f"{'='*60}")
+
+    for result in results:
+        if "error" in result:
+            print(f"  {'ERROR':<15} {result['error']}")
+            continue
+
+        days_old = result.get("days_old")
+        age = f"{days_old:.1f}d" if days_old is not None else "?"
+        name = Path(result["handoff_file"]).name
+        print(f"  {result['staleness_level']:<15} {age:>8}  {name}")
+        for issue in result.get("issues", [])[:3]:
+            print(f"  {'':<15} {'':>8}    - {issue}")
+
+    print(f"{'='*60}")
+
+
 def print_report(result: dict):
     """Print staleness report."""
     if "error" in result:
@@ -312,11 +748,12 @@ def print_report(result: dict):
 
     if result["created"]:
         print(f"Created: {result['created'].strftime('%Y-%m-%d %H:%M:%S')}")
-        if result["days_old"] is not None:
-            if result["days_old"] < 1:
-                print(f"Age: {result['hours_old']:.1f} hours")
-            else:
-                print(f"Age: {result['days_old']:.1f} days")
+    if result["days_old"] is not None:
+        source = " (from file mtime)" if result.get("age_source") == "mtime" else ""
+        if result["days_old"] < 1:
+            print(f"Age: {result['hours_old']:.1f} hours{source}")
+        else:
+            print(f"Age: {result['days_old']:.1f} days{source}")
 
     print(f"\n{'='*60}")
     print(f"Staleness Level: {result['staleness_level']}")
@@ -333,8 +770,15 @@ def print_report(result: dict):
         print(f"Handoff branch: {result.get('handoff_branch', 'Unknown')}")
         print(f"Current branch: {result.get('current_branch', 'Unknown')}")
         print(f"Branch matches: {'Yes' if result.get('branch_matches') else 'No'}")
-        print(f"Commits since handoff: {result.get('commits_since', 0)}")
-        print(f"Files changed: {result.get('files_changed_count', 0)}")
+        if result.get("history_skipped"):
+            print("Commits since handoff: not computed (age and branch already VERY_STALE)")
+            print("Files changed: not computed")
+        elif result.get("history_timed_out"):
+            print("Commits since handoff: not computed (git timed out)")
+            print("Files changed: not computed")
+        else:
+            print(f"Commits since handoff: {result.get('commits_since', 0)}")
+            print(f"Files changed: {result.get('files_changed_count', 0)}")
 
         if result.get("recent_commits"):
             print(f"\nRecent commits:")
@@ -362,24 +806,38 @@ def print_report(result: dict):
         print("Verdict: [UNKNOWN] Manual verification needed")
 
 
+def exit_code_for(result: dict) -> int:
+    """Map a staleness result to the CLI exit code (0 ok, 1 stale, 2 very stale/unknown)."""
+    level = result.get("staleness_level", "UNKNOWN")
+    if level in ["FRESH", "SLIGHTLY_STALE"]:
+        return 0
+    elif level == "STALE":
+        return 1
+    else:
+        return 2
+
+
 def main():
     if len(sys.argv) < 2:
         print("Usage: python check_staleness.py <handoff-file>")
+        print("       python check_staleness.py --all [project-path]")
         print("Example: python check_staleness.py docs/handoffs/2024-01-15-auth.md")
         sys.exit(1)
 
+    if sys.argv[1] == "--all":
+        project_path = sys.argv[2] if len(sys.argv) > 2 else os.getcwd()
+        results = check_all(project_path)
+        if not results:
+            print(f"No handoffs found in {project_path}/docs/handoffs/")
+            sys.exit(0)
+        print_summary(results)
+        sys.exit(max(exit_code_for(result) for result in results))
+
     handoff_path = sys.argv[1]
     result = check_staleness(handoff_path)
     print_report(result)
 
-    # Exit code based on staleness
-    level = result.get("staleness_level", "UNKNOWN")
-    if level in ["FRESH", "SLIGHTLY_STALE"]:
-        sys.exit(0)
-    elif level == "STALE":
-        sys.exit(1)
-    else:
-        sys.exit(2)
+    sys.exit(exit_code_for(result))
 
 
 if __name__ == "__main__":
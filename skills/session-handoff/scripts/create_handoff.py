@@ -20,11 +20,24 @@ Usage:
 import argparse
 import os
 import re
+import string
 import subprocess
 import sys
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
+from operator import itemgetter
 from pathlib import Path
 
+try:
+    import pygit2  # Optional: in-process git access without forking
+except ImportError:
+    pygit2 = None
+
+# Handoff title and filename patterns
+TITLE_RE = re.compile(rb'^#\s+(?:Handoff:\s*)?(.+)$', re.MULTILINE)
+FILENAME_DATE_RE = re.compile(r'(\d{4}-\d{2}-\d{2})-(\d{6})')
+TITLE_SCAN_BYTES = 4096  # Titles sit at the top; read this much before the rest
+
 
 def run_cmd(cmd: list[str], cwd: str = None) -> tuple[bool, str]:
     """Run a command and return (success, output)."""
@@ -51,41 +64,99 @@ def get_git_info(project_path: str) -> dict:
         "staged_files": [],
     }
 
+    if pygit2 is not None:
+        return get_git_info_pygit2(project_path, info)
+
+    # One status call covers the repo check, branch, and modified/staged
+    # files; it runs alongside the log query
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        status_future = executor.submit(
+            run_cmd,
+            ["git", "--no-optional-locks", "status", "--porcelain=v2", "--branch",
+             "-z", "--untracked-files=no"],
+            project_path
+        )
+        log_future = executor.submit(
+            run_cmd, ["git", "log", "--oneline", "-5", "--no-decorate"], project_path
+        )
+
     # Check if git repo
-    success, _ = run_cmd(["git", "rev-parse", "--git-dir"], cwd=project_path)
+    success, status = status_future.result()
     if not success:
         return info
 
     info["is_git_repo"] = True
-
-    # Get current branch
-    success, branch = run_cmd(["git", "branch", "--show-current"], cwd=project_path)
-    if success and branch:
-        info["branch"] = branch
+    parse_status_v2(status, info)
 
     # Get recent commits (last 5)
-    success, log = run_cmd(
-        ["git", "log", "--oneline", "-5", "--no-decorate"],
-        cwd=project_path
-    )
+    success, log = log_future.result()
     if success and log:
-        info["recent_commits"] = log.split("\n")
+        info["recent_commits"] = log.splitlines()
 
-    # Get modified files (unstaged)
-    success, modified = run_cmd(
-        ["git", "diff", "--name-only"],
-        cwd=project_path
-    )
-    if success and modified:
-        info["modified_files"] = modified.split("\n")
+    return info
 
-    # Get staged files
-    success, staged = run_cmd(
-        ["git", "diff", "--name-only", "--cached"],
-        cwd=project_path
-    )
-    if success and staged:
-        info["staged_files"] = staged.split("\n")
+
+def parse_status_v2(status: str, info: dict) -> None:
+    """Fill branch, modified and staged files from `git status --porcelain=v2 -z`."""
+    # -z output: NUL-terminated records, safe for names containing newlines
+    records = iter(status.split("\0"))
+    for record in records:
+        kind = record[:1]
+        if kind == "#":
+            if record.startswith("# branch.head "):
+                head = record[len("# branch.head "):]
+                if head != "(detached)":
+                    info["branch"] = head
+            continue
+
+        if kind == "1":
+            path = record.split(" ", 8)[8]
+        elif kind == "2":
+            path = record.split(" ", 9)[9]
+            next(records, None)  # Rename/copy source path follows as its own record
+        elif kind == "u":
+            path = record.split(" ", 10)[10]
+        else:
+            continue
+
+        # XY: index (staged) status, then working tree (unstaged) status
+        staged, unstaged = record[2], record[3]
+        if unstaged != "." or kind == "u":
+            info["modified_files"].append(path)
+        if staged != "." or kind == "u":
+            info["staged_files"].append(path)
+
+
+def get_git_info_pygit2(project_path: str, info: dict) -> dict:
+    """Fill in git information in-process via pygit2."""
+    try:
+        repo = pygit2.Repository(project_path)
+    except pygit2.GitError:
+        return info
+
+    info["is_git_repo"] = True
+
+    if not repo.head_is_unborn:
+        if not repo.head_is_detached:
+            info["branch"] = repo.head.shorthand
+
+        # Get recent commits (last 5)
+        for commit in repo.walk(repo.head.target, pygit2.GIT_SORT_TIME):
+            if len(info["recent_commits"]) == 5:
+                break
+            subject = commit.message.split("\n", 1)[0]
+            info["recent_commits"].append(f"{commit.short_id} {subject}")
+
+    # Get modified files (unstaged): index vs working tree
+    info["modified_files"] = [d.new_file.path for d in repo.diff().deltas]
+
+    # Get staged files: HEAD vs index (everything is staged before the first commit)
+    if repo.head_is_unborn:
+        info["staged_files"] = [entry.path for entry in repo.index]
+    else:
+        info["staged_files"] = [
+            d.new_file.path for d in repo.diff("HEAD", cached=True).deltas
+        ]
 
     return info
 
@@ -96,50 +167,92 @@ def get_handoffs_dir(project_path: str) -> Path:
     return Path(project_path) / "docs" / "handoffs"
 
 
-def find_previous_handoffs(project_path: str) -> list[dict]:
-    """Find existing handoffs in the project."""
+def read_title(path: str, default: str) -> str:
+    """Extract a handoff's title, usually reading only the head of the file."""
+    # Match on raw bytes and decode only the title itself
+    try:
+        with open(path, "rb") as f:
+            content = f.read(TITLE_SCAN_BYTES)
+            match = TITLE_RE.search(content)
+            # A match that runs to the end of the chunk may be a cut-off line
+            if not match or match.end() == len(content):
+                rest = f.read()
+                if rest:
+                    content += rest
+                    match = TITLE_RE.search(content)
+    except Exception:
+        return default
+    if not match:
+        return default
+    return match.group(1).decode("utf-8", "replace").strip()
+
+
+def find_previous_handoffs(project_path: str, name_filter: str = None) -> list[dict]:
+    """Find existing handoffs in the project.
+
+    With name_filter, only files whose name contains it are read.
+    """
     handoffs_dir = get_handoffs_dir(project_path)
-    if not handoffs_dir.exists():
-        return []
 
     handoffs = []
-    for filepath in handoffs_dir.glob("*.md"):
-        # Extract title from file
-        try:
-            content = filepath.read_text()
-            match = re.search(r'^#\s+(?:Handoff:\s*)?(.+)$', content, re.MULTILINE)
-            title = match.group(1).strip() if match else filepath.stem
-        except Exception:
-            title = filepath.stem
-
-        # Parse date from filename
-        date_match = re.match(r'(\d{4}-\d{2}-\d{2})-(\d{6})', filepath.name)
-        if date_match:
-            try:
-                date = datetime.strptime(
-                    f"{date_match.group(1)} {date_match.group(2)}",
-                    "%Y-%m-%d %H%M%S"
-                )
-            except ValueError:
-                date = None
-        else:
-            date = None
+    try:
+        entries = os.scandir(handoffs_dir)
+    except OSError:
+        return []
 
-        handoffs.append({
-            "filename": filepath.name,
-            "path": str(filepath),
-            "title": title,
-            "date": date,
-        })
+    with entries:
+        for entry in entries:
+            name = entry.name
+            if not name.endswith(".md") or entry.is_dir():
+                continue
+            if name_filter and name_filter not in name:
+                continue
+            stem = name[:-3]
+
+            # Extract title from file
+            title = read_title(entry.path, stem)
+
+            # Parse date from filename
+            date_match = FILENAME_DATE_RE.match(name)
+            if date_match:
+                try:
+                    date = datetime.strptime(
+                        f"{date_match.group(1)} {date_match.group(2)}",
+                        "%Y-%m-%d %H%M%S"
+                    )
+                except ValueError:
+                    date = None
+            else:
+                date = None
 
-    # Sort by date, most recent first
-    handoffs.sort(key=lambda x: x["date"] or datetime.min, reverse=True)
+            handoffs.append({
+                "filename": name,
+                "path": entry.path,
+                "title": title,
+                "date": date,
+            })
+
+    # Sort by date, most recent first; undated handoffs keep scan order at the end
+    dated = [h for h in handoffs if h["date"] is not None]
+    dated.sort(key=itemgetter("date"), reverse=True)
+    handoffs = dated + [h for h in handoffs if h["date"] is None]
     return handoffs
 
 
-def get_previous_handoff_info(project_path: str, continues_from: str = None) -> dict:
-    """Get information about the previous handoff for chaining."""
-    handoffs = find_previous_handoffs(project_path)
+def get_previous_handoff_info(
+    project_path: str,
+    continues_from: str = None,
+    handoffs: list[dict] = None
+) -> dict:
+    """Get information about the previous handoff for chaining.
+
+    Pass handoffs when the caller has already listed them to avoid a rescan.
+    """
+    if continues_from:
+        # Only handoffs matching the requested name need their titles read
+        handoffs = find_previous_handoffs(project_path, name_filter=continues_from)
+    elif handoffs is None:
+        handoffs = find_previous_handoffs(project_path)
 
     if continues_from:
         # Find specific handoff
@@ -165,87 +278,19 @@ def get_previous_handoff_info(project_path: str, continues_from: str = None) ->
     return {"exists": False}
 
 
-def generate_handoff(
-    project_path: str,
-    slug: str = None,
-    continues_from: str = None
-) -> str:
-    """Generate a handoff document with pre-filled metadata."""
-
-    # Generate timestamp and filename
-    now = datetime.now()
-    timestamp = now.strftime("%Y-%m-%d %H:%M:%S")
-    file_timestamp = now.strftime("%Y-%m-%d-%H%M%S")
-
-    if not slug:
-        slug = "handoff"
-
-    # Sanitize slug
-    slug = slug.lower().replace(" ", "-").replace("_", "-")
-    slug = "".join(c for c in slug if c.isalnum() or c == "-")
-
-    filename = f"{file_timestamp}-{slug}.md"
-
-    # Create handoffs directory
-    handoffs_dir = get_handoffs_dir(project_path)
-    handoffs_dir.mkdir(parents=True, exist_ok=True)
-
-    filepath = handoffs_dir / filename
-
-    # Gather git info
-    git_info = get_git_info(project_path)
-
-    # Get previous handoff info for chaining
-    prev_handoff = get_previous_handoff_info(project_path, continues_from)
-
-    # Build pre-filled sections
-    branch_line = git_info["branch"] if git_info["branch"] else "[not a git repo or detached HEAD]"
-
-    # Recent commits section
-    if git_info["recent_commits"]:
-        commits_section = "\n".join(f"  - {c}" for c in git_info["recent_commits"])
-    else:
-        commits_section = "  - [no recent commits or not a git repo]"
-
-    # Modified files section
-    all_modified = list(set(git_info["modified_files"] + git_info["staged_files"]))
-    if all_modified:
-        modified_section = "\n".join(f"| {f} | [describe changes] | [why changed] |" for f in all_modified[:10])
-        if len(all_modified) > 10:
-            modified_section += f"\n| ... and {len(all_modified) - 10} more files | | |"
-    else:
-        modified_section = "| [no modified files detected] | | |"
-
-    # Handoff chain section
-    if prev_handoff.get("exists"):
-        chain_section = f"""## Handoff Chain
-
-- **Continues from**: [{prev_handoff['filename']}](./{prev_handoff['filename']})
-  - Previous title: {prev_handoff.get('title', 'Unknown')}
-- **Supersedes**: [list any older handoffs this replaces, or "None"]
-
-> Review the previous handoff for full context before filling this one."""
-    else:
-        chain_section = """## Handoff Chain
-
-- **Continues from**: None (fresh start)
-- **Supersedes**: None
-
-> This is the first handoff for this task."""
-
-    # Generate the document
-    content = f"""# Handoff: [TASK_TITLE - replace this]
+# Handoff document scaffold; parsed once, filled per call by generate_handoff()
+HANDOFF_TEMPLATE = string.Template("""# Handoff: [TASK_TITLE - replace this]
 
 ## Session Metadata
-- Created: {timestamp}
-- Project: {project_path}
-- Branch: {branch_line}
+- Created: ${timestamp}
+- Project: ${project_path}
+- Branch: ${branch_line}
 - Session duration: [estimate how long you worked]
 
 ### Recent Commits (for context)
-{commits_section}
+${commits_section}
 
-{chain_section}
+${chain_section}
 
 ## Current State Summary
 
@@ -277,7 +322,7 @@ def generate_handoff(
 
 | File | Changes | Rationale |
 |------|---------|-----------|
-{modified_section}
+${modified_section}
 
 ### Decisions Made
 
@@ -336,10 +381,94 @@ def generate_handoff(
 ---
 
 **Security Reminder**: Before finalizing, run `validate_handoff.py` to check for accidental secret exposure.
-"""
+""")
+
+
+def generate_handoff(
+    project_path: str,
+    slug: str = None,
+    continues_from: str = None,
+    previous_handoffs: list[dict] = None
+) -> str:
+    """Generate a handoff document with pre-filled metadata.
+
+    previous_handoffs, if given, is reused instead of rescanning docs/handoffs/.
+    """
+
+    # Generate timestamp and filename
+    now = datetime.now()
+    timestamp = now.strftime("%Y-%m-%d %H:%M:%S")
+    file_timestamp = now.strftime("%Y-%m-%d-%H%M%S")
+
+    if not slug:
+        slug = "handoff"
+
+    # Sanitize slug
+    slug = slug.lower().replace(" ", "-").replace("_", "-")
+    slug = "".join(c for c in slug if c.isalnum() or c == "-")
+
+    filename = f"{file_timestamp}-{slug}.md"
+
+    # Create handoffs directory
+    handoffs_dir = get_handoffs_dir(project_path)
+    handoffs_dir.mkdir(parents=True, exist_ok=True)
+
+    filepath = handoffs_dir / filename
+
+    # Gather git info
+    git_info = get_git_info(project_path)
+
+    # Get previous handoff info for chaining
+    prev_handoff = get_previous_handoff_info(project_path, continues_from, previous_handoffs)
+
+    # Build pre-filled sections
+    branch_line = git_info["branch"] if git_info["branch"] else "[not a git repo or detached HEAD]"
+
+    # Recent commits section
+    if git_info["recent_commits"]:
+        commits_section = "\n".join(f"  - {c}" for c in git_info["recent_commits"])
+    else:
+        commits_section = "  - [no recent commits or not a git repo]"
+
+    # Modified files section
+    all_modified = list(set(git_info["modified_files"] + git_info["staged_files"]))
+    if all_modified:
+        modified_rows = [f"| {f} | [describe changes] | [why changed] |" for f in all_modified[:10]]
+        if len(all_modified) > 10:
+            modified_rows.append(f"| ... and {len(all_modified) - 10} more files | | |")
+        modified_section = "\n".join(modified_rows)
+    else:
+        modified_section = "| [no modified files detected] | | |"
+
+    # Handoff chain section
+    if prev_handoff.get("exists"):
+        chain_section = f"""## Handoff Chain
+
+- **Continues from**: [{prev_handoff['filename']}](./{prev_handoff['filename']})
+  - Previous title: {prev_handoff.get('title', 'Unknown')}
+- **Supersedes**: [list any older handoffs this replaces, or "None"]
+
+> Review the previous handoff for full context before filling this one."""
+    else:
+        chain_section = """## Handoff Chain
+
+- **Continues from**: None (fresh start)
+- **Supersedes**: None
+
+> This is the first handoff for this task."""
+
+    # Generate the document
+    content = HANDOFF_TEMPLATE.substitute(
+        timestamp=timestamp,
+        project_path=project_path,
+        branch_line=branch_line,
+        commits_section=commits_section,
+        chain_section=chain_section,
+        modified_section=modified_section,
+    )
 
     # Write the file
-    filepath.write_text(content)
+    filepath.write_bytes(content.encode("utf-8"))
 
     return str(filepath)
 
@@ -366,6 +495,7 @@ def main():
     project_path = os.getcwd()
 
     # Check for existing handoffs to suggest chaining
+    prev_handoffs = None
     if not args.continues_from:
         prev_handoffs = find_previous_handoffs(project_path)
         if prev_handoffs:
@@ -374,7 +504,7 @@ def main():
             print(f"Use --continues-from <filename> to link handoffs.\n")
 
     # Generate handoff
-    filepath = generate_handoff(project_path, args.slug, args.continues_from)
+    filepath = generate_handoff(project_path, args.slug, args.continues_from, prev_handoffs)
 
     print(f"Created handoff document: {filepath}")
     print(f"\nNext steps:")
@@ -15,9 +15,17 @@ Usage:
 import os
 import re
 import sys
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
+from operator import itemgetter
 from pathlib import Path
 
+# Handoff title pattern
+TITLE_RE = re.compile(r'^#\s+(?:Handoff:\s*)?(.+)$', re.MULTILINE)
+
+# Below this many handoffs, starting a thread pool costs more than the reads
+PARALLEL_READ_MIN = 5
+
 
 def get_handoffs_dir(project_path: str) -> Path:
     """Get the handoffs directory path."""
@@ -25,72 +33,124 @@ def get_handoffs_dir(project_path: str) -> Path:
     return Path(project_path) / "docs" / "handoffs"
 
 
+def read_handoff(filepath: str | Path) -> str | None:
+    """Read a handoff document, or None if it can't be read."""
+    try:
+        with open(filepath) as f:
+            return f.read()
+    except Exception:
+        return None
+
+
 def extract_title(filepath: Path) -> str:
     """Extract the title from a handoff document."""
-    try:
-        content = filepath.read_text()
+    return extract_title_from_text(read_handoff(filepath))
+
+
+def find_title(content: str) -> re.Match | None:
+    """Match TITLE_RE at the first line that has a title, as ``search`` would.
+
+    Only lines starting with "#" are tried, found with ``str.find`` instead
+    of attempting the pattern at every offset. A well-formed handoff opens
+    with its title, so the first try usually succeeds.
+    """
+    if content.startswith("#"):
+        match = TITLE_RE.match(content)
+        if match:
+            return match
+    pos = content.find("\n#")
+    while pos != -1:
+        match = TITLE_RE.match(content, pos + 1)
+        if match:
+            return match
+        pos = content.find("\n#", pos + 1)
+    return None
+
+
+def extract_title_from_text(content: str | None) -> str:
+    """Extract the title from a handoff document's text."""
+    if content is not None:
         # Look for first H1 header
-        match = re.search(r'^#\s+(?:Handoff:\s*)?(.+)$', content, re.MULTILINE)
+        match = find_title(content)
         if match:
             title = match.group(1).strip()
             # Clean up placeholder text
             if title.startswith("[") and title.endswith("]"):
                 return "[Untitled - needs completion]"
             return title[:50] + "..." if len(title) > 50 else title
-    except Exception:
-        pass
     return "[Unable to read title]"
 
 
 def check_completion_status(filepath: Path) -> str:
     """Check if handoff appears complete or has TODOs remaining."""
-    try:
-        content = filepath.read_text()
-        todo_count = content.count("[TODO:")
-        if todo_count == 0:
-            return "Complete"
-        elif todo_count <= 3:
-            return f"In Progress ({todo_count} TODOs)"
-        else:
-            return f"Needs Work ({todo_count} TODOs)"
-    except Exception:
+    return check_completion_status_from_text(read_handoff(filepath))
+
+
+def check_completion_status_from_text(content: str | None) -> str:
+    """Check a handoff document's text for remaining TODOs."""
+    if content is None:
         return "Unknown"
+    todo_count = content.count("[TODO:")
+    if todo_count == 0:
+        return "Complete"
+    elif todo_count <= 3:
+        return f"In Progress ({todo_count} TODOs)"
+    else:
+        return f"Needs Work ({todo_count} TODOs)"
 
 
 def parse_date_from_filename(filename: str) -> datetime | None:
     """Extract date from filename like 2024-01-15-143022-slug.md"""
-    match = re.match(r'(\d{4}-\d{2}-\d{2})-(\d{6})', filename)
-    if match:
-        try:
-            date_str = match.group(1)
-            time_str = match.group(2)
-            return datetime.strptime(f"{date_str} {time_str}", "%Y-%m-%d %H%M%S")
-        except ValueError:
-            pass
-    return None
+    # Fixed-width layout, so slice it rather than run a regex and strptime
+    fields = (filename[0:4], filename[5:7], filename[8:10],
+              filename[11:13], filename[13:15], filename[15:17])
+    if (len(filename) < 17 or not filename[:17].isascii() or filename[4] != "-"
+            or filename[7] != "-" or filename[10] != "-"
+            or not all(field.isdecimal() for field in fields)):
+        return None
+    try:
+        return datetime(*map(int, fields))
+    except ValueError:
+        return None
+
+
+def summarize_handoff(entry: os.DirEntry) -> dict:
+    """Build the listing record for one handoff file."""
+    # Read once for both the title and the TODO count
+    content = read_handoff(entry.path)
+    return {
+        "path": entry.path,
+        "filename": entry.name,
+        "title": extract_title_from_text(content),
+        "status": check_completion_status_from_text(content),
+        "date": parse_date_from_filename(entry.name),
+        "size": entry.stat().st_size,
+    }
 
 
 def list_handoffs(project_path: str) -> list[dict]:
     """List all handoff documents in a project."""
     handoffs_dir = get_handoffs_dir(project_path)
 
-    if not handoffs_dir.exists():
+    # One directory scan yields names and types without a Path per entry
+    try:
+        with os.scandir(handoffs_dir) as it:
+            entries = [entry for entry in it
+                       if entry.name.endswith(".md") and entry.is_file()]
+    except OSError:
         return []
 
-    handoffs = []
-    for filepath in handoffs_dir.glob("*.md"):
-        parsed_date = parse_date_from_filename(filepath.name)
-        handoffs.append({
-            "path": str(filepath),
-            "filename": filepath.name,
-            "title": extract_title(filepath),
-            "status": check_completion_status(filepath),
-            "date": parsed_date,
-            "size": filepath.stat().st_size,
-        })
-
-    # Sort by date, most recent first
-    handoffs.sort(key=lambda x: x["date"] or datetime.min, reverse=True)
+    # File reads release the GIL, so larger directories are read in parallel
+    if len(entries) >= PARALLEL_READ_MIN:
+        with ThreadPoolExecutor(max_workers=min(8, len(entries))) as executor:
+            handoffs = list(executor.map(summarize_handoff, entries))
+    else:
+        handoffs = [summarize_handoff(entry) for entry in entries]
+
+    # Sort by date, most recent first; undated handoffs keep scan order at the end
+    dated = [h for h in handoffs if h["date"] is not None]
+    dated.sort(key=itemgetter("date"), reverse=True)
+    handoffs = dated + [h for h in handoffs if h["date"] is None]
 
     return handoffs
 
@@ -14,28 +14,87 @@ Usage:
     python validate_handoff.py docs/handoffs/2024-01-15-143022-auth.md
 """
 
+import functools
 import os
 import re
 import sys
+from bisect import bisect_left
 from pathlib import Path
 
-# Secret detection patterns
+try:
+    import re2  # Optional: google-re2 matches every secret pattern in one pass
+except ImportError:
+    re2 = None
+
+# Secret detection patterns, each with a lowercase substring every match contains.
+# Patterns start at the key name itself: a leading [a-zA-Z_]* only made the
+# engine rescan letter runs without changing how many matches are found.
+# Quoted values must close on the same line.
 SECRET_PATTERNS = [
-    (r'["\']?[a-zA-Z_]*api[_-]?key["\']?\s*[:=]\s*["\'][^"\']{10,}["\']', "API key"),
-    (r'["\']?[a-zA-Z_]*password["\']?\s*[:=]\s*["\'][^"\']+["\']', "Password"),
-    (r'["\']?[a-zA-Z_]*secret["\']?\s*[:=]\s*["\'][^"\']{10,}["\']', "Secret"),
-    (r'["\']?[a-zA-Z_]*token["\']?\s*[:=]\s*["\'][^"\']{20,}["\']', "Token"),
-    (r'["\']?[a-zA-Z_]*private[_-]?key["\']?\s*[:=]', "Private key"),
-    (r'-----BEGIN [A-Z]+ PRIVATE KEY-----', "PEM private key"),
-    (r'mongodb(\+srv)?://[^/\s]+:[^@\s]+@', "MongoDB connection string with password"),
-    (r'postgres://[^/\s]+:[^@\s]+@', "PostgreSQL connection string with password"),
-    (r'mysql://[^/\s]+:[^@\s]+@', "MySQL connection string with password"),
-    (r'Bearer\s+[a-zA-Z0-9_\-\.]+', "Bearer token"),
-    (r'ghp_[a-zA-Z0-9]{36}', "GitHub personal access token"),
-    (r'sk-[a-zA-Z0-9]{48}', "OpenAI API key"),
-    (r'xox[baprs]-[a-zA-Z0-9-]+', "Slack token"),
+    (r'api[_-]?key["\']?\s*[:=]\s*["\'][^"\'\n]{10,}["\']', "API key", "api"),
+    (r'password["\']?\s*[:=]\s*["\'][^"\'\n]+["\']', "Password", "password"),
+    (r'secret["\']?\s*[:=]\s*["\'][^"\'\n]{10,}["\']', "Secret", "secret"),
+    (r'token["\']?\s*[:=]\s*["\'][^"\'\n]{20,}["\']', "Token", "token"),
+    (r'private[_-]?key["\']?\s*[:=]', "Private key", "private"),
+    (r'-----BEGIN [A-Z]+ PRIVATE KEY-----', "PEM private key", "-----begin "),
+    (r'mongodb(\+srv)?://[^/\s]+:[^@\s]+@', "MongoDB connection string with password", "mongodb"),
+    (r'postgres://[^/\s]+:[^@\s]+@', "PostgreSQL connection string with password", "postgres://"),
+    (r'mysql://[^/\s]+:[^@\s]+@', "MySQL connection string with password", "mysql://"),
+    (r'Bearer\s+[a-zA-Z0-9_\-\.]+', "Bearer token", "bearer"),
+    (r'ghp_[a-zA-Z0-9]{36}', "GitHub personal access token", "ghp_"),
+    (r'sk-[a-zA-Z0-9]{48}', "OpenAI API key", "sk-"),
+    (r'xox[baprs]-[a-zA-Z0-9-]+', "Slack token", "xox"),
 ]
 
+SECRET_RES = [(re.compile(pattern, re.IGNORECASE), description, trigger)
+              for pattern, description, trigger in SECRET_PATTERNS]
+
+# re.IGNORECASE also equates these with ASCII letters; lower() leaves them be,
+# or for U+0130 splits it into "i" and a combining dot
+CASE_FOLD_EXTRA = str.maketrans({"\u017f": "s", "\u0131": "i", "\u0130": "i"})
+
+
+# The RE2 set only prunes candidates, so it must match wherever re does.
+# RE2's \s is ASCII-only and its case folding leaves U+0130/U+0131 apart
+# from "i", so its copies of the patterns spell out what re also accepts.
+RE2_EXTRA_SPACE = (r'\x0b\x1c-\x1f\x85\xa0\x{1680}\x{2000}-\x{200a}'
+                   r'\x{2028}\x{2029}\x{202f}\x{205f}\x{3000}')
+RE2_EXTRA_I = r'\x{130}\x{131}'
+RE2_TOKEN_RE = re.compile(r'\[(?:\\.|[^\]])*\]|\\.|[iI]')
+
+
+def _re2_pattern(pattern: str) -> str:
+    """Widen a secret pattern's \\s and i/I for RE2 to match re's str semantics."""
+    def widen(match):
+        token = match.group()
+        if token.startswith("["):
+            token = token.replace(r'\s', r'\s' + RE2_EXTRA_SPACE)
+            if "a-z" in token or "A-Z" in token:
+                token = "[" + RE2_EXTRA_I + token[1:]
+            return token
+        if token == r'\s':
+            return rf'[\s{RE2_EXTRA_SPACE}]'
+        if token in ("i", "I"):
+            return f"[i{RE2_EXTRA_I}]"
+        return token
+    return RE2_TOKEN_RE.sub(widen, pattern)
+
+
+def _build_secret_set():
+    """Compile all secret patterns into one RE2 set, or None without re2."""
+    if re2 is None:
+        return None
+    options = re2.Options()
+    options.case_sensitive = False
+    secret_set = re2.Set.SearchSet(options)
+    for pattern, _, _ in SECRET_PATTERNS:
+        secret_set.Add(_re2_pattern(pattern))
+    secret_set.Compile()
+    return secret_set
+
+
+SECRET_SET = _build_secret_set()
+
 # Required sections for a complete handoff
 REQUIRED_SECTIONS = [
     "Current State Summary",
@@ -53,27 +112,82 @@ RECOMMENDED_SECTIONS = [
     "Potential Gotchas",
 ]
 
+TODO_RE = re.compile(r'\[TODO:[^\]]*\]')
+
+# Headers are only looked for where a line starts with "#"; a section ends at
+# the next line starting with "#" or "##" and whitespace
+HEADER_LINE_RE = re.compile(r'^#', re.MULTILINE)
+SECTION_BREAK_RE = re.compile(r'##?\s+')
+
+
+def _section_re(section: str) -> re.Pattern:
+    """Compile the header pattern for one section name, matched at a "#"."""
+    return re.compile(rf'##?\s*{re.escape(section)}', re.IGNORECASE)
+
+
+REQUIRED_SECTION_RES = [(section, _section_re(section)) for section in REQUIRED_SECTIONS]
+RECOMMENDED_SECTION_RES = [(section, _section_re(section)) for section in RECOMMENDED_SECTIONS]
+ALL_SECTION_RES = REQUIRED_SECTION_RES + RECOMMENDED_SECTION_RES
+
+# File references, one alternative per style; no two can match overlapping
+# text, so a single pass finds the same paths as three separate ones
+FILE_REF_RE = re.compile(
+    r'\|\s*(?P<table>[a-zA-Z0-9_\-./]+\.[a-zA-Z]+)\s*\|'  # | path/to/file | in tables
+    r'|`(?P<code>[a-zA-Z0-9_\-./]+\.[a-zA-Z]+(?::\d+)?)`'  # `path/to/file` in code
+    r'|(?:^|\s)(?P<line>[a-zA-Z0-9_\-./]+\.[a-zA-Z]+:\d+)'  # path/to/file:123
+)
+
 
 def check_todos(content: str) -> tuple[bool, list[str]]:
     """Check for remaining TODO placeholders."""
-    todos = re.findall(r'\[TODO:[^\]]*\]', content)
+    # Most finished handoffs have none, so skip the regex with a plain search
+    if "[TODO:" not in content:
+        return True, []
+    todos = TODO_RE.findall(content)
     return len(todos) == 0, todos
 
 
-def check_required_sections(content: str) -> tuple[bool, list[str]]:
-    """Check that required sections exist and have content."""
+def find_sections(content: str, section_res: list) -> tuple[dict[str, int], list[int]]:
+    """Scan the header lines once.
+
+    Returns where each section's first header ends, and the offsets of the
+    newlines that start every section break, in order.
+    """
+    header_ends = {}
+    breaks = []
+    pending = section_res
+    for line in HEADER_LINE_RE.finditer(content):
+        pos = line.start()
+        if pos and SECTION_BREAK_RE.match(content, pos):
+            breaks.append(pos - 1)
+        if pending:
+            unmatched = []
+            for section, header_re in pending:
+                match = header_re.match(content, pos)
+                if match:
+                    header_ends[section] = match.end()
+                else:
+                    unmatched.append((section, header_re))
+            pending = unmatched
+    return header_ends, breaks
+
+
+def check_required_sections(content: str, sections: tuple = None) -> tuple[bool, list[str]]:
+    """Check that required sections exist and have content.
+
+    ``sections`` is a ``find_sections`` result to reuse instead of scanning.
+    """
+    header_ends, breaks = sections or find_sections(content, REQUIRED_SECTION_RES)
     missing = []
-    for section in REQUIRED_SECTIONS:
+    for section, _ in REQUIRED_SECTION_RES:
         # Look for section header
-        pattern = rf'(?:^|\n)##?\s*{re.escape(section)}'
-        match = re.search(pattern, content, re.IGNORECASE)
-        if not match:
+        section_start = header_ends.get(section)
+        if section_start is None:
             missing.append(f"{section} (missing)")
         else:
             # Check if section has meaningful content (not just placeholder)
-            section_start = match.end()
-            next_section = re.search(r'\n##?\s+', content[section_start:])
-            section_end = section_start + next_section.start() if next_section else len(content)
+            next_break = bisect_left(breaks, section_start)
+            section_end = breaks[next_break] if next_break < len(breaks) else len(content)
             section_content = content[section_start:section_end].strip()
 
             # 50 chars minimum: roughly 1-2 sentences, enough to convey meaningful context
@@ -83,21 +197,28 @@ def check_required_sections(content: str) -> tuple[bool, list[str]]:
     return len(missing) == 0, missing
 
 
-def check_recommended_sections(content: str) -> list[str]:
-    """Check which recommended sections are missing."""
-    missing = []
-    for section in RECOMMENDED_SECTIONS:
-        pattern = rf'(?:^|\n)##?\s*{re.escape(section)}'
-        if not re.search(pattern, content, re.IGNORECASE):
-            missing.append(section)
-    return missing
+def check_recommended_sections(content: str, sections: tuple = None) -> list[str]:
+    """Check which recommended sections are missing.
+
+    ``sections`` is a ``find_sections`` result to reuse instead of scanning.
+    """
+    header_ends, _ = sections or find_sections(content, RECOMMENDED_SECTION_RES)
+    return [section for section, _ in RECOMMENDED_SECTION_RES if section not in header_ends]
 
 
 def scan_for_secrets(content: str) -> list[tuple[str, str]]:
     """Scan content for potential secrets."""
+    # Rule out patterns whose required substring is absent before any regex
+    folded = content.translate(CASE_FOLD_EXTRA).lower()
+    candidates = [i for i, (_, _, trigger) in enumerate(SECRET_RES) if trigger in folded]
+    if candidates and SECRET_SET is not None:
+        # One RE2 pass finds which patterns hit; only those are counted below
+        hits = set(SECRET_SET.Match(content) or ())  # None when nothing matches
+        candidates = [i for i in candidates if i in hits]
+
     findings = []
-    for pattern, description in SECRET_PATTERNS:
-        matches = re.findall(pattern, content, re.IGNORECASE)
+    for regex, description, _ in (SECRET_RES[i] for i in candidates):
+        matches = regex.findall(content)
         if matches:
             findings.append((description, f"Found {len(matches)} potential match(es)"))
     return findings
@@ -105,41 +226,44 @@ def scan_for_secrets(content: str) -> list[tuple[str, str]]:
 
 def check_file_references(content: str, handoff_path: Path) -> tuple[list[str], list[str]]:
     """Check if referenced files exist."""
-    # Extract file paths from content (look for common patterns)
-    # Pattern 1: | path/to/file | in tables
-    # Pattern 2: `path/to/file` in code
-    # Pattern 3: path/to/file:123 with line numbers
+    return resolve_file_references(find_file_references(content), handoff_path)
 
-    patterns = [
-        r'\|\s*([a-zA-Z0-9_\-./]+\.[a-zA-Z]+)\s*\|',  # Table cells
-        r'`([a-zA-Z0-9_\-./]+\.[a-zA-Z]+(?::\d+)?)`',  # Inline code
-        r'(?:^|\s)([a-zA-Z0-9_\-./]+\.[a-zA-Z]+:\d+)',  # With line numbers
-    ]
 
+def find_file_references(content: str) -> set[str]:
+    """Extract referenced file paths from a handoff's text."""
+    # Extract file paths from content (see FILE_REF_RE for the patterns)
     found_files = set()
-    for pattern in patterns:
-        matches = re.findall(pattern, content)
-        for match in matches:
-            # Remove line numbers
-            filepath = match.split(':')[0]
-            # Skip obvious non-files
-            if filepath and not filepath.startswith('http') and '/' in filepath:
-                found_files.add(filepath)
+    for match in FILE_REF_RE.finditer(content):
+        # Remove line numbers
+        filepath = (match['table'] or match['code'] or match['line']).split(':')[0]
+        # Skip obvious non-files
+        if filepath and not filepath.startswith('http') and '/' in filepath:
+            found_files.add(filepath)
+    return found_files
 
+
+def resolve_file_references(found_files, handoff_path: Path) -> tuple[list[str], list[str]]:
+    """Split referenced file paths into those that exist and those that don't."""
     existing = []
     missing = []
 
     handoff_dir = handoff_path.parent
     docs_dir = handoff_dir.parent
     repo_root = docs_dir.parent
+    # Plain strings, so joining a reference onto them builds no Path objects
+    roots = (
+        os.fspath(handoff_dir),  # relative to handoff file
+        os.fspath(docs_dir),     # relative to docs/
+        os.fspath(repo_root),    # relative to repository root
+    )
 
+    listings = {}
     for filepath in found_files:
-        candidates = [
-            handoff_dir / filepath,  # relative to handoff file
-            docs_dir / filepath,     # relative to docs/
-            repo_root / filepath,    # relative to repository root
-        ]
-        if any(candidate.exists() for candidate in candidates):
+        candidates = [os.path.join(root, filepath) for root in roots]
+        # Directory listings answer most lookups; stat only what they can't
+        # settle (symlinks, and misses on case-insensitive filesystems)
+        if (any(_listed(candidate, listings) for candidate in candidates)
+                or any(os.path.exists(candidate) for candidate in candidates)):
             existing.append(filepath)
         else:
             missing.append(filepath)
@@ -147,6 +271,21 @@ def check_file_references(content: str, handoff_path: Path) -> tuple[list[str],
     return existing, missing
 
 
+def _listed(path: str, listings: dict) -> bool:
+    """Check a path against its directory's listing, scanning each directory once."""
+    parent, name = os.path.split(path)
+    entries = listings.get(parent)
+    if entries is None:
+        try:
+            with os.scandir(parent) as it:
+                entries = {entry.name: entry.is_symlink() for entry in it}
+        except OSError:
+            entries = {}
+        listings[parent] = entries
+    # A symlink may dangle, so leave it to the exists() fallback
+    return entries.get(name) is False
+
+
 def calculate_quality_score(
     todos_clear: bool,
     required_complete: bool,
@@ -203,20 +342,42 @@ def calculate_quality_score(
     return score, rating
 
 
+@functools.lru_cache(maxsize=1024)
+def _check_content(filepath: str, mtime_ns: int, size: int) -> tuple:
+    """Run the checks that depend only on a handoff's text.
+
+    Keyed on modification time and size as well as path, so an edited file
+    is read again. Results are tuples so cached values can't be mutated.
+    """
+    content = Path(filepath).read_text()
+    todos_clear, remaining_todos = check_todos(content)
+    # One pass over the header lines serves both section checks
+    sections = find_sections(content, ALL_SECTION_RES)
+    required_complete, missing_required = check_required_sections(content, sections)
+    return (
+        todos_clear, tuple(remaining_todos),
+        required_complete, tuple(missing_required),
+        tuple(check_recommended_sections(content, sections)),
+        tuple(scan_for_secrets(content)),
+        frozenset(find_file_references(content)),
+    )
+
+
 def validate_handoff(filepath: str) -> dict:
     """Run all validations on a handoff file."""
     path = Path(filepath)
 
-    if not path.exists():
+    try:
+        st = os.stat(path)
+    except (FileNotFoundError, NotADirectoryError):
         return {"error": f"File not found: {filepath}"}
 
-    content = path.read_text()
-    # Run checks
-    todos_clear, remaining_todos = check_todos(content)
-    required_complete, missing_required = check_required_sections(content)
-    missing_recommended = check_recommended_sections(content)
-    secrets_found = scan_for_secrets(content)
-    existing_files, missing_files = check_file_references(content, path)
+    # Run checks; unchanged files reuse their earlier text checks
+    (todos_clear, remaining_todos, required_complete, missing_required,
+     missing_recommended, secrets_found, referenced) = _check_content(
+        str(path), st.st_mtime_ns, st.st_size)
+    # Referenced files can appear or vanish without the handoff changing
+    existing_files, missing_files = resolve_file_references(referenced, path)
 
     # Calculate score
     score, rating = calculate_quality_score(
@@ -229,12 +390,12 @@ def validate_handoff(filepath: str) -> dict:
         "score": score,
         "rating": rating,
         "todos_clear": todos_clear,
-        "remaining_todos": remaining_todos[:5],  # Limit output
+        "remaining_todos": list(remaining_todos[:5]),  # Limit output
         "todo_count": len(remaining_todos) if not todos_clear else 0,
         "required_complete": required_complete,
-        "missing_required": missing_required,
-        "missing_recommended": missing_recommended,
-        "secrets_found": secrets_found,
+        "missing_required": list(missing_required),
+        "missing_recommended": list(missing_recommended),
+        "secrets_found": list(secrets_found),
         "files_verified": len(existing_files),
         "files_missing": missing_files[:5],  # Limit output
     }